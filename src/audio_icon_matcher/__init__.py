@@ -19,7 +19,6 @@ Example usage:
         print(f"{match.icon.name}: {match.confidence:.2f}")
 """
 
-from .core.pipeline import AudioIconPipeline
 from .models.results import AudioIconResult, IconMatch
 from .core.exceptions import AudioIconError, AudioIconValidationError
 
@@ -31,3 +30,11 @@ __all__ = [
     "AudioIconError",
     "AudioIconValidationError"
 ]
+
+
+def __getattr__(name):
+    """Import the pipeline on first access to keep package import lightweight."""
+    if name == "AudioIconPipeline":
+        from .core.pipeline import AudioIconPipeline
+        return AudioIconPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
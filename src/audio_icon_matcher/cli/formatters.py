@@ -0,0 +1,235 @@
+"""Output formatters for audio-to-icon pipeline results."""
+
+import json
+
+# json.dumps builds a new encoder whenever options are passed; reuse one instead
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+_JSON_LINES_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Per-match blocks of the table output, rendered with a single format call each
+_MATCH_HEADER_TEMPLATE = "{index}. {name}\n   URL: {url}"
+_MATCH_DETAILS_TEMPLATE = (
+    "   Confidence: {confidence:.2f}\n"
+    "   Match Reason: {reason}\n"
+    "   Matched Subjects: {subjects}\n"
+)
+
+
+def _icon_view(icon):
+    """Read the icon fields used by the formatters in one pass.
+    
+    Returns:
+        Tuple of (name, url, category, tags); tags is an empty list if the
+        icon has no tags attribute, and None is passed through as is
+    """
+    return icon.name, icon.url, getattr(icon, 'category', None), getattr(icon, 'tags', [])
+
+
+def _match_to_json(match) -> dict:
+    """Convert a single icon match to its JSON-serializable form."""
+    name, url, category, tags = _icon_view(match.icon)
+    return {
+        "icon_name": name,
+        "icon_url": url,
+        "icon_category": category,
+        "icon_tags": tags,
+        "confidence": match.confidence,
+        "match_reason": match.match_reason,
+        "subjects_matched": match.subjects_matched
+    }
+
+
+def _format_match_block(index: int, match) -> str:
+    """Format a single icon match as a numbered table block."""
+    name, url, category, tags = _icon_view(match.icon)
+    block_lines = [_MATCH_HEADER_TEMPLATE.format(index=index, name=name, url=url)]
+    if category:
+        block_lines.append(f"   Category: {category}")
+    if tags:
+        block_lines.append(f"   Tags: {', '.join(tags)}")
+    block_lines.append(_MATCH_DETAILS_TEMPLATE.format(
+        confidence=match.confidence,
+        reason=match.match_reason,
+        subjects=', '.join(match.subjects_matched)
+    ))
+    return "\n".join(block_lines)
+
+
+def _format_json_output(result) -> str:
+    """Format result as JSON."""
+    # Convert to JSON-serializable format
+    output_data = {
+        "success": result.success,
+        "transcription": result.transcription,
+        "transcription_confidence": result.transcription_confidence,
+        "subjects": result.subjects,
+        "processing_time": result.processing_time,
+        "metadata": result.metadata,
+        "icon_matches": [_match_to_json(match) for match in result.icon_matches]
+    }
+    
+    if not result.success:
+        output_data["error"] = result.error
+    
+    return _JSON_ENCODER.encode(output_data)
+
+
+def _format_table_output(result) -> str:
+    """Format result as a table."""
+    output_lines = []
+    output_lines.append("=" * 80)
+    output_lines.append("AUDIO TO ICON PROCESSING RESULTS")
+    output_lines.append("=" * 80)
+    
+    # Basic information
+    output_lines.append(f"Success: {'✓' if result.success else '✗'}")
+    
+    # Source information
+    source_type = result.metadata.get('source_type', 'local_file')
+    if source_type == 'podcast':
+        output_lines.append(f"Source: Podcast URL")
+        if 'episode_title' in result.metadata and result.metadata['episode_title']:
+            output_lines.append(f"Episode: {result.metadata['episode_title']}")
+        if 'show_name' in result.metadata and result.metadata['show_name']:
+            output_lines.append(f"Show: {result.metadata['show_name']}")
+    else:
+        output_lines.append(f"Source: Local Audio File")
+        if 'audio_file' in result.metadata:
+            output_lines.append(f"File: {result.metadata['audio_file']}")
+    
+    if result.transcription:
+        output_lines.append(f"Transcription: {result.transcription[:100]}{'...' if len(result.transcription) > 100 else ''}")
+        output_lines.append(f"Transcription Confidence: {result.transcription_confidence:.2f}")
+    output_lines.append(f"Processing Time: {result.processing_time:.2f}s")
+    
+    if not result.success and result.error:
+        output_lines.append(f"Error: {result.error}")
+        return "\n".join(output_lines)
+    
+    # Subjects found
+    if result.subjects:
+        output_lines.append("\nSUBJECTS IDENTIFIED:")
+        output_lines.append("-" * 40)
+        
+        for subject_type, subjects_list in result.subjects.items():
+            if subjects_list:
+                output_lines.append(f"{subject_type.upper()}:")
+                for subject in subjects_list:
+                    if isinstance(subject, dict):
+                        name = subject.get('name', 'Unknown')
+                        conf = subject.get('confidence', 0)
+                        output_lines.append(f"  • {name} (confidence: {conf:.2f})")
+                    else:
+                        output_lines.append(f"  • {subject}")
+    
+    # Icon matches
+    if result.icon_matches:
+        output_lines.append(f"\nICON MATCHES FOUND ({len(result.icon_matches)}):")
+        output_lines.append("-" * 40)
+        
+        for i, match in enumerate(result.icon_matches, 1):
+            output_lines.append(_format_match_block(i, match))
+    else:
+        output_lines.append("\nNo icon matches found.")
+    
+    # Metadata
+    if result.metadata:
+        output_lines.append("METADATA:")
+        output_lines.append("-" * 40)
+        for key, value in result.metadata.items():
+            output_lines.append(f"{key}: {value}")
+    
+    output_lines.append("=" * 80)
+    return "\n".join(output_lines)
+
+
+def _format_summary_output(result) -> str:
+    """Format result as a summary."""
+    output_lines = []
+    
+    # Summary header
+    status = "SUCCESS" if result.success else "FAILED"
+    source_type = result.metadata.get('source_type', 'local_file')
+    source_desc = "PODCAST" if source_type == 'podcast' else "LOCAL FILE"
+    output_lines.append(f"AUDIO-TO-ICON PROCESSING {status} ({source_desc})")
+    output_lines.append("=" * 50)
+    
+    if not result.success:
+        output_lines.append(f"Error: {result.error}")
+        return "\n".join(output_lines)
+    
+    # Source information
+    if source_type == 'podcast':
+        if 'episode_title' in result.metadata and result.metadata['episode_title']:
+            output_lines.append(f"Episode: {result.metadata['episode_title']}")
+        if 'show_name' in result.metadata and result.metadata['show_name']:
+            output_lines.append(f"Show: {result.metadata['show_name']}")
+    
+    # Key metrics
+    output_lines.append(f"Processing time: {result.processing_time:.2f}s")
+    if result.transcription_confidence:
+        output_lines.append(f"Transcription confidence: {result.transcription_confidence:.2f}")
+    
+    # Subject summary
+    total_subjects = sum(len(subjects_list) for subjects_list in result.subjects.values() if subjects_list)
+    output_lines.append(f"Subjects found: {total_subjects}")
+    
+    # Icon match summary
+    output_lines.append(f"Icon matches: {len(result.icon_matches)}")
+    
+    if result.icon_matches:
+        output_lines.append("\nTop matches:")
+        for i, match in enumerate(result.icon_matches[:3], 1):  # Show top 3
+            output_lines.append(f"  {i}. {match.icon.name} (confidence: {match.confidence:.2f})")
+    
+    return "\n".join(output_lines)
+
+
+def _format_stream_event(event: str, payload) -> str:
+    """Format a non-match streaming event from the pipeline as text.
+    
+    Args:
+        event: Event name ("transcription", "subjects" or "result")
+        payload: Event payload as yielded by AudioIconPipeline.process_streaming
+        
+    Returns:
+        Text line(s) describing the event
+    """
+    if event == "transcription":
+        return f"Transcription: {payload[:100]}{'...' if len(payload) > 100 else ''}"
+    if event == "subjects":
+        counts = [f"{len(items)} {subject_type}" for subject_type, items in payload.items() if items]
+        return f"Subjects identified: {', '.join(counts) if counts else 'none'}\n\nICON MATCHES:"
+    if not payload.success:
+        return f"❌ Processing failed: {payload.error}"
+    if not payload.icon_matches:
+        return "No icon matches found.\n" + f"Processing Time: {payload.processing_time:.2f}s"
+    return f"Processing Time: {payload.processing_time:.2f}s"
+
+
+def _format_ndjson_event(event: str, payload) -> str:
+    """Format a streaming event from the pipeline as a single JSON line.
+    
+    Args:
+        event: Event name ("transcription", "subjects", "icon_match" or "result")
+        payload: Event payload as yielded by AudioIconPipeline.process_streaming
+        
+    Returns:
+        Compact JSON object tagged with the event name
+    """
+    if event == "transcription":
+        output_data = {"event": event, "transcription": payload}
+    elif event == "subjects":
+        output_data = {"event": event, "subjects": payload}
+    elif event == "icon_match":
+        output_data = {"event": event, **_match_to_json(payload)}
+    else:
+        output_data = {
+            "event": event,
+            "success": payload.success,
+            "processing_time": payload.processing_time,
+            "metadata": payload.metadata
+        }
+        if not payload.success:
+            output_data["error"] = payload.error
+    return _JSON_LINES_ENCODER.encode(output_data)
@@ -1,13 +1,107 @@
 """CLI commands for audio-to-icon pipeline."""
 
 import click
+import os
 import sys
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional
 
-from ..core.pipeline import AudioIconPipeline
 from ..core.exceptions import AudioIconValidationError, AudioIconProcessingError
+from ..core.formats import SORTED_FORMATS, URL_PREFIXES, validate_extension
+from .formatters import (
+    _format_json_output,
+    _format_table_output,
+    _format_summary_output,
+    _format_match_block,
+    _format_stream_event,
+    _format_ndjson_event
+)
+
+if TYPE_CHECKING:
+    from ..core.pipeline import AudioIconPipeline
+
+# Write buffer for --output-file; large JSON results go out in few syscalls
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+_FORMATTERS = {
+    "json": _format_json_output,
+    "table": _format_table_output,
+    "summary": _format_summary_output,
+}
+
+# Static help text, emitted with a single write per command
+_FORMATS_TEXT = """\
+SUPPORTED AUDIO FORMATS
+========================================
+Local audio files:
+""" + "\n".join(f"  • .{fmt}" for fmt in SORTED_FORMATS) + """
+
+SUPPORTED PODCAST SOURCES
+========================================
+  • RSS/XML podcast feeds
+  • Direct audio episode URLs
+  • Most major podcast platforms"""
+
+INFO_TEXT = """\
+AUDIO-ICON MATCHER
+==================================================
+Analyze audio content to find matching icons based on identified subjects
+and themes in audio files or podcast episodes.
+
+COMMANDS:
+  find-icons   Find matching icons for audio source
+  validate     Validate audio source without processing
+  formats      List supported audio formats and sources
+  info         Show this information
+
+FEATURES:
+  • Audio transcription using Whisper
+  • Subject identification (keywords, topics, entities)
+  • Intelligent icon matching with confidence scoring
+  • Multiple output formats (JSON, table, summary)
+  • Configurable confidence thresholds
+
+SUPPORTED SOURCES:
+  • Local files: WAV, MP3, M4A formats
+  • Podcast feeds: RSS/XML feeds
+  • Direct URLs: Direct links to audio files
+
+EXAMPLES:
+  # Find icons for local audio file
+  audio-icon-matcher find-icons my_audio.mp3
+
+  # Find icons for podcast episode
+  audio-icon-matcher find-icons https://podcast.example.com/episode.rss
+
+  # Get JSON output with custom threshold
+  audio-icon-matcher find-icons audio.wav --output-format json --confidence-threshold 0.5
+
+For detailed help with any command:
+  audio-icon-matcher COMMAND --help"""
+
+
+def _get_formatter(output_format: str) -> Callable[[Any], str]:
+    """Resolve the formatter for an output format, falling back to the table format.
+    
+    Args:
+        output_format: Format type ("json", "table", "summary")
+        
+    Returns:
+        Function that renders an AudioIconResult as a string
+    """
+    return _FORMATTERS.get(output_format, _format_table_output)
+
+
+@lru_cache(maxsize=1)
+def _get_pipeline() -> "AudioIconPipeline":
+    """Get the shared pipeline, constructing it on first use.
+    
+    The pipeline module pulls in Whisper, spaCy and the icon database layer,
+    so it is only imported by commands that actually process audio.
+    """
+    from ..core.pipeline import AudioIconPipeline
+    return AudioIconPipeline()
 
 
 @click.group(name="audio-icon-matcher")
@@ -20,11 +114,12 @@ def audio_icon_matcher_commands():
 @click.argument("audio_source", type=str)
 @click.option("--max-icons", type=int, default=10, help="Maximum number of icons to return")
 @click.option("--confidence-threshold", type=float, default=0.3, help="Minimum confidence threshold")
-@click.option("--output-format", type=click.Choice(["json", "table", "summary"]), default="table", help="Output format")
+@click.option("--output-format", type=click.Choice(list(_FORMATTERS)), default="table", help="Output format")
 @click.option("--output-file", type=click.Path(path_type=Path), help="Output file (if not specified, prints to stdout)")
 @click.option("--episode-index", type=int, default=0, help="Episode index from RSS feed (0 = most recent, 1 = second most recent, etc.)")
 @click.option("--episode-title", type=str, help="Find episode by title (partial match, case-insensitive)")
-def find_matching_icons(audio_source, max_icons, confidence_threshold, output_format, output_file, episode_index, episode_title):
+@click.option("--stream", is_flag=True, help="Print partial results as they become available (JSON Lines for json format; ignored with --output-file)")
+def find_matching_icons(audio_source, max_icons, confidence_threshold, output_format, output_file, episode_index, episode_title, stream):
     """Find matching icons for audio source (local file or podcast URL).
     
     AUDIO_SOURCE can be:
@@ -38,23 +133,40 @@ def find_matching_icons(audio_source, max_icons, confidence_threshold, output_fo
     - Use --episode-title "title" to find episode by title (partial match)
     """
     try:
-        pipeline = AudioIconPipeline()
+        # The output format is fixed for the invocation, so resolve it once
+        formatter = _get_formatter(output_format)
         
         # Determine source type and validate
-        if audio_source.startswith(('http://', 'https://')):
+        if audio_source.startswith(URL_PREFIXES):
             # Podcast URL validation
+            pipeline = _get_pipeline()
             if not pipeline.validate_podcast_url(audio_source):
                 raise AudioIconValidationError(f"Invalid or unsupported podcast URL: {audio_source}")
             click.echo(f"Finding icons for podcast episode: {audio_source}")
         else:
-            # Local file validation
-            audio_path = Path(audio_source)
-            if not audio_path.exists():
+            # Local file validation: one stat plus an extension check, so bad
+            # input fails before the pipeline is built
+            try:
+                os.stat(audio_source)
+            except FileNotFoundError:
                 raise AudioIconValidationError(f"Audio file not found: {audio_source}")
-            if not pipeline.validate_audio_file(audio_source):
+            if not validate_extension(audio_source):
                 raise AudioIconValidationError(f"Unsupported audio format: {audio_source}")
+            pipeline = _get_pipeline()
             click.echo(f"Finding icons for audio file: {audio_source}")
         
+        if stream and not output_file:
+            # Print each stage's output as soon as the pipeline produces it
+            events = pipeline.process_streaming(
+                audio_source,
+                max_icons=max_icons,
+                confidence_threshold=confidence_threshold,
+                episode_index=episode_index,
+                episode_title=episode_title
+            )
+            _stream_results(events, output_format)
+            return
+        
         # Process the audio source using unified pipeline
         result = pipeline.process(
             audio_source,
@@ -65,7 +177,7 @@ def find_matching_icons(audio_source, max_icons, confidence_threshold, output_fo
         )
         
         # Format and output results
-        _output_results(result, output_format, output_file)
+        _output_results(result, formatter, output_file)
             
     except AudioIconValidationError as e:
         click.echo(f"❌ Validation Error: {e}", err=True)
@@ -78,33 +190,43 @@ def find_matching_icons(audio_source, max_icons, confidence_threshold, output_fo
         sys.exit(1)
 
 
-def _output_results(result, output_format: str, output_file: Optional[Path] = None):
+def _output_results(result, formatter: Callable[[Any], str], output_file: Optional[Path] = None):
     """Handle result formatting and output to file or stdout.
     
     Args:
         result: AudioIconResult to format and output
-        output_format: Format type ("json", "table", "summary")
+        formatter: Formatter resolved by _get_formatter
         output_file: Optional file path to write to
     """
-    # Format output based on type
-    if output_format == "json":
-        output_data = _format_json_output(result)
-    elif output_format == "table":
-        output_data = _format_table_output(result)
-    elif output_format == "summary":
-        output_data = _format_summary_output(result)
-    else:
-        output_data = _format_table_output(result)  # Default fallback
+    output_data = formatter(result)
     
     # Output results
     if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with open(os.fspath(output_file), 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
             f.write(output_data)
         click.echo(f"✅ Results written to {output_file}")
     else:
         click.echo(output_data)
 
 
+def _stream_results(events, output_format: str):
+    """Echo pipeline streaming events to stdout as they arrive.
+    
+    Args:
+        events: Iterator of (event, payload) tuples from AudioIconPipeline.process_streaming
+        output_format: Format type; "json" emits JSON Lines, anything else emits text
+    """
+    match_index = 0
+    for event, payload in events:
+        if output_format == "json":
+            click.echo(_format_ndjson_event(event, payload))
+        elif event == "icon_match":
+            match_index += 1
+            click.echo(_format_match_block(match_index, payload))
+        else:
+            click.echo(_format_stream_event(event, payload))
+
+
 @audio_icon_matcher_commands.command("validate")
 @click.argument("audio_source", type=str)
 def validate_audio_source(audio_source):
@@ -115,15 +237,13 @@ def validate_audio_source(audio_source):
     - Podcast episode URL (RSS feed or direct audio link)
     """
     try:
-        pipeline = AudioIconPipeline()
-        
-        if audio_source.startswith(('http://', 'https://')):
+        if audio_source.startswith(URL_PREFIXES):
             # Validate podcast URL
-            is_valid = pipeline.validate_podcast_url(audio_source)
+            is_valid = _get_pipeline().validate_podcast_url(audio_source)
             source_type = "podcast URL"
         else:
-            # Validate local file
-            is_valid = pipeline.validate_audio_file(audio_source)
+            # Validate local file (format and existence only, no pipeline needed)
+            is_valid = validate_extension(audio_source) and Path(audio_source).exists()
             source_type = "audio file"
         
         if is_valid:
@@ -140,215 +260,13 @@ def validate_audio_source(audio_source):
 @audio_icon_matcher_commands.command("formats")
 def list_supported_formats():
     """List supported audio formats and sources."""
-    try:
-        pipeline = AudioIconPipeline()
-        formats = pipeline.get_supported_formats()
-        
-        click.echo("SUPPORTED AUDIO FORMATS")
-        click.echo("=" * 40)
-        click.echo("Local audio files:")
-        for fmt in sorted(formats):
-            click.echo(f"  • .{fmt}")
-        
-        click.echo("\nSUPPORTED PODCAST SOURCES")
-        click.echo("=" * 40)
-        click.echo("  • RSS/XML podcast feeds")
-        click.echo("  • Direct audio episode URLs")
-        click.echo("  • Most major podcast platforms")
-            
-    except Exception as e:
-        click.echo(f"❌ Error getting formats: {e}", err=True)
-        sys.exit(1)
-
-
-def _format_json_output(result) -> str:
-    """Format result as JSON."""
-    # Convert to JSON-serializable format
-    output_data = {
-        "success": result.success,
-        "transcription": result.transcription,
-        "transcription_confidence": result.transcription_confidence,
-        "subjects": result.subjects,
-        "processing_time": result.processing_time,
-        "metadata": result.metadata,
-        "icon_matches": [
-            {
-                "icon_name": match.icon.name,
-                "icon_url": match.icon.url,
-                "icon_category": getattr(match.icon, 'category', None),
-                "icon_tags": getattr(match.icon, 'tags', []),
-                "confidence": match.confidence,
-                "match_reason": match.match_reason,
-                "subjects_matched": match.subjects_matched
-            }
-            for match in result.icon_matches
-        ]
-    }
-    
-    if not result.success:
-        output_data["error"] = result.error
-    
-    return json.dumps(output_data, indent=2, ensure_ascii=False)
-
-
-def _format_table_output(result) -> str:
-    """Format result as a table."""
-    output_lines = []
-    output_lines.append("=" * 80)
-    output_lines.append("AUDIO TO ICON PROCESSING RESULTS")
-    output_lines.append("=" * 80)
-    
-    # Basic information
-    output_lines.append(f"Success: {'✓' if result.success else '✗'}")
-    
-    # Source information
-    source_type = result.metadata.get('source_type', 'local_file')
-    if source_type == 'podcast':
-        output_lines.append(f"Source: Podcast URL")
-        if 'episode_title' in result.metadata and result.metadata['episode_title']:
-            output_lines.append(f"Episode: {result.metadata['episode_title']}")
-        if 'show_name' in result.metadata and result.metadata['show_name']:
-            output_lines.append(f"Show: {result.metadata['show_name']}")
-    else:
-        output_lines.append(f"Source: Local Audio File")
-        if 'audio_file' in result.metadata:
-            output_lines.append(f"File: {result.metadata['audio_file']}")
-    
-    if result.transcription:
-        output_lines.append(f"Transcription: {result.transcription[:100]}{'...' if len(result.transcription) > 100 else ''}")
-        output_lines.append(f"Transcription Confidence: {result.transcription_confidence:.2f}")
-    output_lines.append(f"Processing Time: {result.processing_time:.2f}s")
-    
-    if not result.success and result.error:
-        output_lines.append(f"Error: {result.error}")
-        return "\n".join(output_lines)
-    
-    # Subjects found
-    if result.subjects:
-        output_lines.append("\nSUBJECTS IDENTIFIED:")
-        output_lines.append("-" * 40)
-        
-        for subject_type, subjects_list in result.subjects.items():
-            if subjects_list:
-                output_lines.append(f"{subject_type.upper()}:")
-                for subject in subjects_list:
-                    if isinstance(subject, dict):
-                        name = subject.get('name', 'Unknown')
-                        conf = subject.get('confidence', 0)
-                        output_lines.append(f"  • {name} (confidence: {conf:.2f})")
-                    else:
-                        output_lines.append(f"  • {subject}")
-    
-    # Icon matches
-    if result.icon_matches:
-        output_lines.append(f"\nICON MATCHES FOUND ({len(result.icon_matches)}):")
-        output_lines.append("-" * 40)
-        
-        for i, match in enumerate(result.icon_matches, 1):
-            output_lines.append(f"{i}. {match.icon.name}")
-            output_lines.append(f"   URL: {match.icon.url}")
-            if hasattr(match.icon, 'category') and match.icon.category:
-                output_lines.append(f"   Category: {match.icon.category}")
-            if hasattr(match.icon, 'tags') and match.icon.tags:
-                output_lines.append(f"   Tags: {', '.join(match.icon.tags)}")
-            output_lines.append(f"   Confidence: {match.confidence:.2f}")
-            output_lines.append(f"   Match Reason: {match.match_reason}")
-            output_lines.append(f"   Matched Subjects: {', '.join(match.subjects_matched)}")
-            output_lines.append("")
-    else:
-        output_lines.append("\nNo icon matches found.")
-    
-    # Metadata
-    if result.metadata:
-        output_lines.append("METADATA:")
-        output_lines.append("-" * 40)
-        for key, value in result.metadata.items():
-            output_lines.append(f"{key}: {value}")
-    
-    output_lines.append("=" * 80)
-    return "\n".join(output_lines)
-
-
-def _format_summary_output(result) -> str:
-    """Format result as a summary."""
-    output_lines = []
-    
-    # Summary header
-    status = "SUCCESS" if result.success else "FAILED"
-    source_type = result.metadata.get('source_type', 'local_file')
-    source_desc = "PODCAST" if source_type == 'podcast' else "LOCAL FILE"
-    output_lines.append(f"AUDIO-TO-ICON PROCESSING {status} ({source_desc})")
-    output_lines.append("=" * 50)
-    
-    if not result.success:
-        output_lines.append(f"Error: {result.error}")
-        return "\n".join(output_lines)
-    
-    # Source information
-    if source_type == 'podcast':
-        if 'episode_title' in result.metadata and result.metadata['episode_title']:
-            output_lines.append(f"Episode: {result.metadata['episode_title']}")
-        if 'show_name' in result.metadata and result.metadata['show_name']:
-            output_lines.append(f"Show: {result.metadata['show_name']}")
-    
-    # Key metrics
-    output_lines.append(f"Processing time: {result.processing_time:.2f}s")
-    if result.transcription_confidence:
-        output_lines.append(f"Transcription confidence: {result.transcription_confidence:.2f}")
-    
-    # Subject summary
-    total_subjects = sum(len(subjects_list) for subjects_list in result.subjects.values() if subjects_list)
-    output_lines.append(f"Subjects found: {total_subjects}")
-    
-    # Icon match summary
-    output_lines.append(f"Icon matches: {len(result.icon_matches)}")
-    
-    if result.icon_matches:
-        output_lines.append("\nTop matches:")
-        for i, match in enumerate(result.icon_matches[:3], 1):  # Show top 3
-            output_lines.append(f"  {i}. {match.icon.name} (confidence: {match.confidence:.2f})")
-    
-    return "\n".join(output_lines)
+    click.echo(_FORMATS_TEXT)
 
 
 @audio_icon_matcher_commands.command("info")
 def show_info():
     """Show information about the audio-icon matcher."""
-    click.echo("AUDIO-ICON MATCHER")
-    click.echo("=" * 50)
-    click.echo("Analyze audio content to find matching icons based on identified subjects")
-    click.echo("and themes in audio files or podcast episodes.")
-    click.echo("")
-    click.echo("COMMANDS:")
-    click.echo("  find-icons   Find matching icons for audio source")
-    click.echo("  validate     Validate audio source without processing")
-    click.echo("  formats      List supported audio formats and sources")
-    click.echo("  info         Show this information")
-    click.echo("")
-    click.echo("FEATURES:")
-    click.echo("  • Audio transcription using Whisper")
-    click.echo("  • Subject identification (keywords, topics, entities)")
-    click.echo("  • Intelligent icon matching with confidence scoring")
-    click.echo("  • Multiple output formats (JSON, table, summary)")
-    click.echo("  • Configurable confidence thresholds")
-    click.echo("")
-    click.echo("SUPPORTED SOURCES:")
-    click.echo("  • Local files: WAV, MP3, M4A formats")
-    click.echo("  • Podcast feeds: RSS/XML feeds")
-    click.echo("  • Direct URLs: Direct links to audio files")
-    click.echo("")
-    click.echo("EXAMPLES:")
-    click.echo("  # Find icons for local audio file")
-    click.echo("  audio-icon-matcher find-icons my_audio.mp3")
-    click.echo("")
-    click.echo("  # Find icons for podcast episode")
-    click.echo("  audio-icon-matcher find-icons https://podcast.example.com/episode.rss")
-    click.echo("")
-    click.echo("  # Get JSON output with custom threshold")
-    click.echo("  audio-icon-matcher find-icons audio.wav --output-format json --confidence-threshold 0.5")
-    click.echo("")
-    click.echo("For detailed help with any command:")
-    click.echo("  audio-icon-matcher COMMAND --help")
+    click.echo(INFO_TEXT)
 
 
 def main():
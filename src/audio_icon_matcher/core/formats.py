@@ -0,0 +1,28 @@
+"""Supported audio formats and source prefixes for the audio-to-icon pipeline.
+
+This module only depends on the lightweight audio format enum so callers can
+check formats without constructing the full pipeline.
+"""
+
+from pathlib import Path
+from typing import Union
+
+from media_analyzer.core.validator import AudioFormat
+
+SUPPORTED_FORMATS = frozenset(audio_format.value for audio_format in AudioFormat)
+SORTED_FORMATS = tuple(sorted(SUPPORTED_FORMATS))
+
+# Audio sources starting with one of these are treated as podcast URLs
+URL_PREFIXES = ('http://', 'https://')
+
+
+def validate_extension(audio_file: Union[str, Path]) -> bool:
+    """Check whether the file extension is a supported audio format.
+
+    Args:
+        audio_file: Path to audio file
+
+    Returns:
+        True if the extension is supported, False otherwise
+    """
+    return Path(audio_file).suffix[1:].lower() in SUPPORTED_FORMATS
@@ -1,24 +1,36 @@
 """Main pipeline for converting audio to icon recommendations."""
 
 import asyncio
+import atexit
+import copy
+import dataclasses
+import hashlib
 import logging
+import os
+import queue
+import threading
 import time
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple, Union
 
 from ..core.exceptions import (
     AudioIconValidationError, 
     AudioIconProcessingError,
     SubjectIdentificationError
 )
+from ..core.formats import SORTED_FORMATS, SUPPORTED_FORMATS, URL_PREFIXES, validate_extension
 from ..models.results import AudioIconResult, IconMatch
-from ..processors.icon_matcher import IconMatcher
+from ..processors.icon_matcher import IconMatcher, SearchCache
 from ..processors.result_ranker import ResultRanker
 
 # Import existing components
 from media_analyzer.processors.audio.audio_processor import AudioProcessor
 from media_analyzer.processors.subject.identifier import SubjectIdentifier
-from media_analyzer.models.subject.identification import SubjectAnalysisResult
+from media_analyzer.models.subject.identification import Context, Subject, SubjectAnalysisResult, SubjectType
 
 # Import podcast components
 from media_analyzer.processors.podcast.analyzer import PodcastAnalyzer
@@ -26,71 +38,298 @@ from media_analyzer.models.podcast import AnalysisOptions, StreamingAnalysisResu
 
 logger = logging.getLogger(__name__)
 
+# Subject dict bucket for each cleaned-up subject type
+_SUBJECT_TYPE_BUCKETS = {
+    'KEYWORD': 'keywords',
+    'TOPIC': 'topics',
+    'ENTITY': 'entities'
+}
+
+# Podcast analysis options shared by every call; AnalysisOptions validates on
+# construction, so the defaults are built once
+_DEFAULT_ANALYSIS_OPTIONS = AnalysisOptions(
+    subject_extraction=True,
+    confidence_threshold=0.3,  # Use lower threshold for subject extraction
+    max_duration_minutes=4     # Limit to 4 minutes for faster processing
+)
+
+# Cleaned-up type label and subject dict bucket for each SubjectType member, so
+# the common case is a single lookup instead of attribute probes and string conversion
+_SUBJECT_TYPE_ROUTES = {
+    subject_type: (subject_type.value.upper(), _SUBJECT_TYPE_BUCKETS[subject_type.value.upper()])
+    for subject_type in SubjectType
+}
+
+# Icon search results the shared icon matcher keeps across files and episodes,
+# and for how many seconds, so icons scraped meanwhile are picked up
+_ICON_SEARCH_CACHE_SIZE = 4096
+_ICON_SEARCH_CACHE_TTL = 300.0
+
+# Threads that run icon searches one at a time if a bulk search fails
+_ICON_SEARCH_WORKERS = 8
+
+# Windowed transcription stops early once the top subjects overlap this much
+# (Jaccard index) between windows for this many windows in a row
+_STABLE_SUBJECT_OVERLAP = 0.8
+_STABLE_SUBJECT_WINDOWS = 2
+
+# Version recorded in every result's metadata
+_PIPELINE_VERSION = '1.1'
+
+# Event loop that runs all podcast I/O on a daemon thread. Reusing one loop
+# avoids creating one per call and keeps the analyzer's HTTP sessions bound to
+# a single loop no matter which thread or loop the caller uses.
+_BACKGROUND_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BACKGROUND_THREAD: Optional[threading.Thread] = None
+_BACKGROUND_LOOP_LOCK = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the pipeline's background event loop, starting it on first use."""
+    global _BACKGROUND_LOOP, _BACKGROUND_THREAD
+    with _BACKGROUND_LOOP_LOCK:
+        if _BACKGROUND_LOOP is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="audio-icon-pipeline-loop",
+                daemon=True
+            )
+            thread.start()
+            _BACKGROUND_LOOP, _BACKGROUND_THREAD = loop, thread
+        return _BACKGROUND_LOOP
+
+
+# Components shared by every pipeline in the process, keyed by attribute name.
+# Whisper and spaCy models are loaded once rather than once per pipeline.
+_MODEL_REGISTRY: Dict[str, Any] = {}
+_MODEL_REGISTRY_LOCK = threading.Lock()
+
+
+def _get_shared_component(name: str, factory: Callable[[], Any]) -> Any:
+    """Get a pipeline component from the shared registry, creating it on first use.
+    
+    Args:
+        name: Registry key for the component
+        factory: Callable that constructs the component
+        
+    Returns:
+        The shared component instance
+    """
+    with _MODEL_REGISTRY_LOCK:
+        component = _MODEL_REGISTRY.get(name)
+        if component is None:
+            component = _MODEL_REGISTRY[name] = factory()
+        return component
+
+
+def _shutdown_background_loop() -> None:
+    """Close the shared podcast sessions and stop the background loop.
+    
+    Runs at interpreter exit. Sessions stay open between calls so connections
+    to podcast hosts are reused; this closes them on the loop that owns them,
+    then stops the loop and waits for its thread. A later call to
+    _get_background_loop starts a fresh loop.
+    """
+    global _BACKGROUND_LOOP, _BACKGROUND_THREAD
+    with _BACKGROUND_LOOP_LOCK:
+        loop, thread = _BACKGROUND_LOOP, _BACKGROUND_THREAD
+        _BACKGROUND_LOOP = _BACKGROUND_THREAD = None
+    if loop is None:
+        return
+    
+    podcast_analyzer = _MODEL_REGISTRY.get('podcast_analyzer')
+    if podcast_analyzer is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(
+                podcast_analyzer.cleanup(), loop
+            ).result(timeout=5)
+        except Exception as e:
+            logger.debug(f"Error closing podcast sessions at exit: {e}")
+    
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    if not thread.is_alive():
+        loop.close()
+
+
+atexit.register(_shutdown_background_loop)
+
+
+def _log_if_not_cleaned(cleanup_state: Dict[str, bool]) -> None:
+    """Note a collected pipeline whose own podcast analyzer was never cleaned up."""
+    if cleanup_state['sessions_open']:
+        logger.debug(
+            "AudioIconPipeline collected without cleanup(); its own podcast "
+            "analyzer's sessions were never closed"
+        )
+
+
+@contextmanager
+def _timed(stage_times: Dict[str, float], stage: str) -> Iterator[None]:
+    """Record the wall time of a pipeline stage, in seconds, under stage_times[stage]."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_times[stage] = time.perf_counter() - start
+
 
 class AudioIconPipeline:
     """Main pipeline for converting audio to icon recommendations."""
     
-    def __init__(self):
-        """Initialize the pipeline with required processors."""
-        self.audio_processor = AudioProcessor()
-        self.subject_identifier = SubjectIdentifier()
-        self.icon_matcher = IconMatcher()
-        self.result_ranker = ResultRanker()
+    SUPPORTED_FORMATS = SUPPORTED_FORMATS
+    
+    def __init__(
+        self,
+        transcription_window_seconds: Optional[float] = None,
+        cache_size: int = 0,
+        max_concurrent_urls: int = 8,
+        stop_when_stable: bool = False
+    ):
+        """Initialize the pipeline.
+        
+        Args:
+            transcription_window_seconds: If set, local files are transcribed in
+                windows of this length and subjects are identified on each window
+                while the next one is transcribed. By default, or when the audio
+                processor has no extract_text_windows, each file is transcribed
+                in a single pass.
+            cache_size: Number of transcriptions (keyed by the SHA-256 of the
+                audio bytes) and subject results (keyed by transcript) to keep
+                for reuse. 0 disables caching.
+            max_concurrent_urls: Maximum number of podcast episodes analyzed
+                at once, across all calls on this pipeline. Keeps batched URL
+                processing within the analyzer's connection pool.
+            stop_when_stable: In windowed mode, stop transcribing once the top
+                max_icons subjects have stayed the same across consecutive
+                windows. Long recordings then only transcribe as much audio as
+                it takes for the leading subjects to settle.
+        
+        Raises:
+            ValueError: If max_concurrent_urls is less than 1
+        """
+        if max_concurrent_urls < 1:
+            raise ValueError("max_concurrent_urls must be at least 1")
+        
+        self.transcription_window_seconds = transcription_window_seconds
+        self.cache_size = cache_size
+        self.max_concurrent_urls = max_concurrent_urls
+        self.stop_when_stable = stop_when_stable
+        self._url_semaphore: Optional[asyncio.Semaphore] = None
+        self._url_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._transcription_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._subject_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         
-        # Initialize podcast analyzer for streaming content
-        self.podcast_analyzer = PodcastAnalyzer()
+        # Tracks whether a podcast analyzer assigned to this pipeline has been
+        # used since the last cleanup(). The shared analyzer is closed by the
+        # exit hook instead. The finalizer only logs.
+        self._cleanup_state = {'sessions_open': False}
+        weakref.finalize(self, _log_if_not_cleaned, self._cleanup_state).atexit = False
+    
+    # Processors are resolved on first access and shared across pipelines.
+    # Assigning an attribute (e.g. a mock) overrides it for this instance only.
+    
+    @cached_property
+    def audio_processor(self) -> AudioProcessor:
+        """Audio processor used for transcription."""
+        return _get_shared_component("audio_processor", AudioProcessor)
+    
+    @cached_property
+    def subject_identifier(self) -> SubjectIdentifier:
+        """Subject identifier used on transcriptions."""
+        return _get_shared_component("subject_identifier", SubjectIdentifier)
+    
+    @cached_property
+    def icon_matcher(self) -> IconMatcher:
+        """Icon matcher used to find candidate icons."""
+        return _get_shared_component(
+            "icon_matcher",
+            lambda: IconMatcher(
+                search_workers=_ICON_SEARCH_WORKERS,
+                bulk_search=True,
+                search_cache_size=_ICON_SEARCH_CACHE_SIZE,
+                search_cache_ttl=_ICON_SEARCH_CACHE_TTL
+            )
+        )
+    
+    @cached_property
+    def result_ranker(self) -> ResultRanker:
+        """Ranker used to order icon matches."""
+        return _get_shared_component("result_ranker", ResultRanker)
+    
+    @cached_property
+    def podcast_analyzer(self) -> PodcastAnalyzer:
+        """Podcast analyzer for streaming content."""
+        return _get_shared_component("podcast_analyzer", PodcastAnalyzer)
     
     def _match_subjects_to_icons(
         self, 
         subjects: Dict[str, Any], 
-        max_icons: int
-    ) -> List[IconMatch]:
+        max_icons: int,
+        search_cache: Optional[SearchCache] = None,
+        confidence_threshold: float = 0.0
+    ) -> Tuple[List[IconMatch], int]:
         """Match subjects to icons and rank results.
         
         Args:
             subjects: Subject identification results
             max_icons: Maximum number of icons to return
+            search_cache: Optional icon search results prefetched while
+                subjects were being identified
+            confidence_threshold: Minimum ranked confidence for a match to
+                be returned
             
         Returns:
-            Ranked list of icon matches
+            Tuple of (ranked icon matches at or above confidence_threshold,
+            number of ranked matches before the threshold was applied)
         """
+        # Only keywords, topics and entities produce search terms (categories
+        # just narrow them), so there is nothing to match without them
+        if not any(subjects.get(subject_type) for subject_type in ('keywords', 'topics', 'entities')):
+            logger.debug("No subjects; skipping icon matching")
+            return [], 0
+        
         # Step 3: Match subjects to icons
-        logger.info("Step 3: Matching subjects to icons...")
+        logger.debug("Step 3: Matching subjects to icons...")
         icon_matches = self.icon_matcher.find_matching_icons(
             subjects, 
-            limit=max_icons * 2  # Get more matches for better ranking
+            limit=max_icons * 2,  # Get more matches for better ranking
+            search_cache=search_cache
         )
         
-        logger.info(f"Found {len(icon_matches)} potential icon matches")
+        logger.debug("Found %d potential icon matches", len(icon_matches))
+        if not icon_matches:
+            return [], 0
         
         # Step 4: Rank and filter results
-        logger.info("Step 4: Ranking and filtering results...")
+        logger.debug("Step 4: Ranking and filtering results...")
+        ranked_count = min(len(icon_matches), max_icons)
         ranked_matches = self.result_ranker.rank_results(
             icon_matches, 
             subjects, 
-            limit=max_icons
+            limit=max_icons,
+            min_confidence=confidence_threshold
         )
         
-        return ranked_matches
+        return ranked_matches, ranked_count
     
-    def _filter_by_confidence(
-        self, 
-        matches: List[IconMatch], 
-        confidence_threshold: float
-    ) -> List[IconMatch]:
-        """Filter matches by confidence threshold.
+    @staticmethod
+    def _build_metadata(source_type: str, **fields: Any) -> Dict[str, Any]:
+        """Build result metadata for the local file and podcast paths.
         
         Args:
-            matches: List of icon matches to filter
-            confidence_threshold: Minimum confidence required
+            source_type: "local_file" or "podcast"
+            **fields: Source-specific metadata, in output order
             
         Returns:
-            Filtered list of matches
+            Metadata dict tagged with the source type and pipeline version
         """
-        return [
-            match for match in matches 
-            if match.confidence >= confidence_threshold
-        ]
+        metadata = {'source_type': source_type}
+        metadata.update(fields)
+        metadata['pipeline_version'] = _PIPELINE_VERSION
+        return metadata
     
     def _create_success_result(
         self,
@@ -177,32 +416,204 @@ class AudioIconPipeline:
         """
         # Determine if source is a URL or local file
         if self._is_url(audio_source):
-            # For URL processing, handle cleanup within the same event loop
-            async def process_with_cleanup():
-                try:
-                    result = await self._process_podcast_url(
-                        audio_source, max_icons, confidence_threshold, episode_index, episode_title
-                    )
-                    return result
-                finally:
-                    # Clean up in the same event loop context
-                    await self.cleanup()
+            return self._run_coroutine(self._process_podcast_url(
+                audio_source, max_icons, confidence_threshold, episode_index, episode_title
+            ), "process")
+        else:
+            return self._process_local_file(
+                audio_source, max_icons, confidence_threshold
+            )
+    
+    def process_many(
+        self, 
+        audio_sources: List[str], 
+        max_icons: int = 10,
+        confidence_threshold: float = 0.3,
+        batch_size: int = 16
+    ) -> List[AudioIconResult]:
+        """Process several audio sources with one set of loaded processors.
+        
+        Local files run through an overlapped transcription, subject and
+        matching pipeline (see _process_local_files_staged), smallest file
+        first so short files are matched while longer ones transcribe and the
+        stages stay busy. Podcast URLs are
+        then analyzed concurrently, up to batch_size at a time, on the same
+        event loop. A failure on one source is reported in its result instead
+        of aborting the rest of the batch.
+        
+        Args:
+            audio_sources: Paths to audio files and/or podcast episode URLs
+            max_icons: Maximum number of icons to return per source
+            confidence_threshold: Minimum confidence for icon matches
+            batch_size: Maximum number of podcast URLs analyzed concurrently
             
-            # Check if we're already in an event loop (e.g., in async tests)
-            try:
-                asyncio.get_running_loop()
-                # If we're here, there's already a running loop
-                # We cannot use asyncio.run(), so we need to raise an error
-                # suggesting to use the async version
-                raise AudioIconProcessingError(
-                    "Cannot process podcast URL in an async context. "
-                    "Use 'await pipeline.process_async()' instead."
+        Returns:
+            One AudioIconResult per source, in input order
+            
+        Raises:
+            ValueError: If batch_size is less than 1
+            AudioIconProcessingError: If called with podcast URLs while an
+                event loop is running
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        results: List[Optional[AudioIconResult]] = [None] * len(audio_sources)
+        local_indices = []
+        url_indices = []
+        for index, audio_source in enumerate(audio_sources):
+            if audio_source.startswith(URL_PREFIXES):
+                url_indices.append(index)
+            else:
+                local_indices.append(index)
+        local_indices.sort(key=lambda index: self._file_size(audio_sources[index]))
+        
+        async def process_all():
+            if local_indices:
+                local_results = await self._process_local_files_staged(
+                    [audio_sources[index] for index in local_indices],
+                    max_icons, confidence_threshold
                 )
-            except RuntimeError:
-                # No running loop, safe to use asyncio.run
-                return asyncio.run(process_with_cleanup())
+                for index, result in zip(local_indices, local_results):
+                    results[index] = result
+            
+            # A rolling limit rather than fixed batches, so one slow episode
+            # does not hold back the URLs queued behind it
+            batch_semaphore = asyncio.Semaphore(batch_size)
+            
+            async def process_url(index):
+                async with batch_semaphore:
+                    results[index] = await self._process_podcast_url(
+                        audio_sources[index], max_icons, confidence_threshold
+                    )
+            
+            await asyncio.gather(*(process_url(index) for index in url_indices))
+        
+        if url_indices:
+            self._run_coroutine(
+                process_all(), "process_many",
+                "Await pipeline.process_async() for each source instead, "
+                "e.g. with asyncio.gather()."
+            )
+        elif local_indices:
+            # Local stages already run in threads and never touch the podcast
+            # sessions on the background loop
+            self._run_local_batch(process_all())
+        
+        return results
+    
+    @staticmethod
+    def _file_size(audio_file: str) -> int:
+        """Get a file's size for batch ordering, or 0 if it cannot be read."""
+        try:
+            return os.path.getsize(audio_file)
+        except OSError:
+            return 0
+    
+    def _get_url_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent episode analyses.
+        
+        Created on first use inside the running loop, and recreated if the
+        background loop has since been replaced.
+        """
+        loop = asyncio.get_running_loop()
+        if self._url_semaphore is None or self._url_semaphore_loop is not loop:
+            self._url_semaphore = asyncio.Semaphore(self.max_concurrent_urls)
+            self._url_semaphore_loop = loop
+        return self._url_semaphore
+    
+    async def _await_in_background(self, coroutine):
+        """Await a coroutine on the background loop from any event loop."""
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coroutine, _get_background_loop())
+        )
+    
+    def _run_coroutine(
+        self,
+        coroutine,
+        api: str,
+        alternative: str = "Use 'await pipeline.process_async()' instead."
+    ):
+        """Run a coroutine to completion on the background loop from synchronous code.
+        
+        Args:
+            coroutine: Coroutine that processes podcast URLs
+            api: Name of the calling public method, for the error message
+            alternative: How to do the same from async code, for the error message
+        
+        Raises:
+            AudioIconProcessingError: If called while an event loop is running
+        """
+        # Check if we're already in an event loop (e.g., in async tests)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop, safe to block on the background loop
+            return asyncio.run_coroutine_threadsafe(coroutine, _get_background_loop()).result()
+        
+        # There's already a running loop, which blocking here would stall
+        coroutine.close()
+        raise AudioIconProcessingError(
+            f"Cannot call {api}() with a podcast URL while an event loop is running. "
+            f"{alternative}"
+        )
+    
+    @staticmethod
+    def _run_local_batch(coroutine):
+        """Run a local-file batch to completion on an event loop of its own.
+        
+        Works whether or not the caller has an event loop running: a running
+        loop is blocked for the length of the batch, as process_async blocks
+        for a local file, while the batch's own loop runs on a helper thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-icon-local-batch") as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+    
+    def process_streaming(
+        self, 
+        audio_source: str, 
+        max_icons: int = 10,
+        confidence_threshold: float = 0.3,
+        episode_index: int = 0,
+        episode_title: Optional[str] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """Process audio source, yielding partial results as each stage completes.
+        
+        Args:
+            audio_source: Path to audio file or podcast episode URL
+            max_icons: Maximum number of icons to return
+            confidence_threshold: Minimum confidence for icon matches
+            episode_index: Episode index from RSS feed (0 = most recent)
+            episode_title: Find episode by title (partial match, case-insensitive)
+            
+        Yields:
+            (event, payload) tuples: ("transcription", str), ("subjects", dict),
+            one ("icon_match", IconMatch) per final match, and finally
+            ("result", AudioIconResult)
+            
+        Raises:
+            AudioIconValidationError: If audio source is invalid
+            AudioIconProcessingError: If processing fails
+        """
+        if self._is_url(audio_source):
+            # Podcast analysis produces transcription and subjects together,
+            # so its events are replayed from the finished result
+            result = self._run_coroutine(self._process_podcast_url(
+                audio_source, max_icons, confidence_threshold, episode_index, episode_title
+            ), "process_streaming")
+            if result.success:
+                yield "transcription", result.transcription
+                yield "subjects", result.subjects
+                for match in result.icon_matches:
+                    yield "icon_match", match
+            yield "result", result
         else:
-            return self._process_local_file(
+            yield from self._iter_local_file_events(
                 audio_source, max_icons, confidence_threshold
             )
     
@@ -232,22 +643,18 @@ class AudioIconPipeline:
         """
         # Determine if source is a URL or local file
         if self._is_url(audio_source):
-            try:
-                result = await self._process_podcast_url(
-                    audio_source, max_icons, confidence_threshold, episode_index, episode_title
-                )
-                return result
-            finally:
-                # Clean up in the same event loop context
-                await self.cleanup()
+            return await self._await_in_background(self._process_podcast_url(
+                audio_source, max_icons, confidence_threshold, episode_index, episode_title
+            ))
         else:
             return self._process_local_file(
                 audio_source, max_icons, confidence_threshold
             )
     
-    def _is_url(self, source: str) -> bool:
+    @staticmethod
+    def _is_url(source: str) -> bool:
         """Check if source is a URL."""
-        return source.startswith(('http://', 'https://'))
+        return source.startswith(URL_PREFIXES)
     
     async def _process_podcast_url(
         self, 
@@ -269,22 +676,28 @@ class AudioIconPipeline:
         Returns:
             AudioIconResult with podcast analysis results
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        if self._own_podcast_analyzer() is not None:
+            self._cleanup_state['sessions_open'] = True
         
         try:
             logger.info(f"Starting podcast analysis for: {url}")
             
-            # Configure podcast analysis options
-            options = AnalysisOptions(
-                subject_extraction=True,
-                confidence_threshold=0.3,  # Use lower threshold for subject extraction
-                max_duration_minutes=4,    # Limit to 4 minutes for faster processing
-                episode_index=episode_index,      # Pass episode selection to options
-                episode_title=episode_title       # Pass episode title to options
-            )
+            # Configure podcast analysis options; only episode selection varies per call
+            if episode_index == 0 and episode_title is None:
+                options = _DEFAULT_ANALYSIS_OPTIONS
+            else:
+                options = dataclasses.replace(
+                    _DEFAULT_ANALYSIS_OPTIONS,
+                    episode_index=episode_index,
+                    episode_title=episode_title
+                )
             
             # Analyze podcast episode (URL will be used with episode selection options)
-            podcast_result = await self.podcast_analyzer.analyze_episode(url, options)
+            stage_times: Dict[str, float] = {}
+            async with self._get_url_semaphore():
+                with _timed(stage_times, 'podcast_analysis'):
+                    podcast_result = await self.podcast_analyzer.analyze_episode(url, options)
             
             if not podcast_result.success:
                 raise AudioIconProcessingError(f"Podcast analysis failed: {podcast_result.error_message}")
@@ -296,14 +709,18 @@ class AudioIconPipeline:
             # Convert subjects to dict format for icon matching (unified method)
             subjects = self._convert_subjects_to_rich_dict(podcast_result.subjects)
             
-            logger.info(f"Podcast analysis complete. Transcription length: {len(transcription)}")
-            logger.info(f"Found {len(subjects)} subject types from podcast")
+            logger.debug("Podcast analysis complete. Transcription length: %d", len(transcription))
+            logger.debug("Found %d subject types from podcast", len(subjects))
             
-            # Use common icon matching and ranking logic
-            ranked_matches = self._match_subjects_to_icons(subjects, max_icons)
-            filtered_matches = self._filter_by_confidence(ranked_matches, confidence_threshold)
+            # Use common icon matching and ranking logic; icon searches block on
+            # the database, so they run off the loop other episodes share
+            with _timed(stage_times, 'icon_matching'):
+                filtered_matches, ranked_count = await asyncio.to_thread(
+                    self._match_subjects_to_icons, subjects, max_icons,
+                    confidence_threshold=confidence_threshold
+                )
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             logger.info(
                 f"Podcast pipeline complete in {processing_time:.2f}s. "
@@ -311,17 +728,17 @@ class AudioIconPipeline:
             )
             
             # Create result with podcast metadata
-            metadata = {
-                'source_type': 'podcast',
-                'source_url': url,
-                'episode_title': podcast_result.episode.title if podcast_result.episode else None,
-                'show_name': podcast_result.episode.show_name if podcast_result.episode else None,
-                'max_icons_requested': max_icons,
-                'confidence_threshold': confidence_threshold,
-                'total_matches_found': len(ranked_matches),
-                'matches_after_filtering': len(filtered_matches),
-                'pipeline_version': '1.1'
-            }
+            metadata = self._build_metadata(
+                'podcast',
+                source_url=url,
+                episode_title=podcast_result.episode.title if podcast_result.episode else None,
+                show_name=podcast_result.episode.show_name if podcast_result.episode else None,
+                max_icons_requested=max_icons,
+                confidence_threshold=confidence_threshold,
+                total_matches_found=ranked_count,
+                matches_after_filtering=len(filtered_matches),
+                stage_times=stage_times
+            )
             
             return self._create_success_result(
                 transcription, transcription_confidence, subjects,
@@ -330,15 +747,12 @@ class AudioIconPipeline:
             
         except Exception as e:
             logger.error(f"Unexpected error in podcast pipeline: {e}")
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Return error result
-            error_metadata = {
-                'source_type': 'podcast',
-                'source_url': url,
-                'error_type': type(e).__name__,
-                'pipeline_version': '1.1'
-            }
+            error_metadata = self._build_metadata(
+                'podcast', source_url=url, error_type=type(e).__name__
+            )
             
             return self._create_error_result(
                 f"Podcast pipeline failed: {e}",
@@ -366,96 +780,519 @@ class AudioIconPipeline:
             AudioIconValidationError: If audio file is invalid
             AudioIconProcessingError: If processing fails
         """
-        start_time = time.time()
+        result = None
+        for event, payload in self._iter_local_file_events(audio_file, max_icons, confidence_threshold):
+            if event == "result":
+                result = payload
+        return result
+    
+    def _iter_local_file_events(
+        self, 
+        audio_file: str, 
+        max_icons: int, 
+        confidence_threshold: float
+    ) -> Iterator[Tuple[str, Any]]:
+        """Run the local file pipeline, yielding each stage's output as it completes.
+        
+        Args:
+            audio_file: Path to audio file to process
+            max_icons: Maximum number of icons to return
+            confidence_threshold: Minimum confidence for icon matches
+            
+        Yields:
+            Streaming events as described in process_streaming, ending with
+            the ("result", AudioIconResult) event
+            
+        Raises:
+            AudioIconValidationError: If audio file is invalid
+            AudioIconProcessingError: If processing fails
+        """
+        start_time = time.perf_counter()
+        stage_times: Dict[str, float] = {}
         
         try:
-            # Validate input file
-            audio_path = Path(audio_file)
-            if not audio_path.exists():
-                raise AudioIconValidationError(f"Audio file not found: {audio_file}")
+            # Audio processors without windowed extraction use the single-pass path
+            if self.transcription_window_seconds and hasattr(self.audio_processor, 'extract_text_windows'):
+                # Subjects are identified between windows, so both are timed together
+                with _timed(stage_times, 'windowed_transcription'):
+                    _, transcription, transcription_confidence, subjects, search_cache = (
+                        self._transcribe_and_identify_windowed(audio_file, max_icons)
+                    )
+                yield "transcription", transcription
+            else:
+                with _timed(stage_times, 'transcription'):
+                    _, transcription, transcription_confidence = self._transcribe_local_file(audio_file)
+                yield "transcription", transcription
                 
-            logger.info(f"Starting audio-to-icon pipeline for: {audio_file}")
+                with _timed(stage_times, 'subject_identification'):
+                    subjects = self._identify_subjects(transcription)
+                search_cache = None
+            yield "subjects", subjects
             
-            # Step 1: Extract text from audio
-            logger.info("Step 1: Extracting text from audio...")
-            audio_result = self.audio_processor.extract_text(audio_path)
+            result = self._create_local_file_result(
+                audio_file, transcription, transcription_confidence, subjects,
+                max_icons, confidence_threshold, start_time, search_cache, stage_times
+            )
+            for match in result.icon_matches:
+                yield "icon_match", match
             
-            if not audio_result or not audio_result.text:
-                raise AudioIconProcessingError("Audio processing failed or produced no text")
+            yield "result", result
             
-            transcription = audio_result.text
-            transcription_confidence = audio_result.confidence
+        except (AudioIconValidationError, AudioIconProcessingError):
+            # Re-raise validation and audio processing errors
+            raise
+        except Exception as e:
+            yield "result", self._create_local_file_error_result(audio_file, e, start_time)
+    
+    async def _process_local_files_staged(
+        self, 
+        audio_files: List[str], 
+        max_icons: int, 
+        confidence_threshold: float
+    ) -> List[AudioIconResult]:
+        """Process local files as overlapping transcription, subject and matching stages.
+        
+        Each stage runs its blocking work in a worker thread and hands its output
+        to the next stage through a queue, so one file can be matched while the
+        next is transcribed. Every stage handles one file at a time, so no
+        processor is ever used from two threads at once.
+        
+        Args:
+            audio_files: Paths to audio files to process
+            max_icons: Maximum number of icons to return per file
+            confidence_threshold: Minimum confidence for icon matches
             
-            logger.info(f"Transcription complete (confidence: {transcription_confidence:.2f})")
-            logger.debug(f"Transcribed text: {transcription[:100]}...")
+        Returns:
+            One AudioIconResult per file, in input order
+        """
+        results: List[Optional[AudioIconResult]] = [None] * len(audio_files)
+        transcribed: asyncio.Queue = asyncio.Queue(maxsize=1)
+        identified: asyncio.Queue = asyncio.Queue(maxsize=1)
+        
+        async def transcribe_stage():
+            for index, audio_file in enumerate(audio_files):
+                start_time = time.perf_counter()
+                stage_times: Dict[str, float] = {}
+                try:
+                    with _timed(stage_times, 'transcription'):
+                        transcribed_file = await asyncio.to_thread(self._transcribe_local_file, audio_file)
+                except (AudioIconValidationError, AudioIconProcessingError) as e:
+                    results[index] = self._create_error_result(
+                        str(e),
+                        time.perf_counter() - start_time,
+                        self._build_metadata(
+                            'local_file', audio_file=audio_file, error_type=type(e).__name__
+                        )
+                    )
+                    continue
+                except Exception as e:
+                    results[index] = self._create_local_file_error_result(audio_file, e, start_time)
+                    continue
+                await transcribed.put((index, start_time, stage_times, transcribed_file))
+            await transcribed.put(None)
+        
+        async def subjects_stage():
+            while True:
+                item = await transcribed.get()
+                if item is None:
+                    break
+                index, start_time, stage_times, (audio_file, transcription, transcription_confidence) = item
+                with _timed(stage_times, 'subject_identification'):
+                    subjects = await asyncio.to_thread(self._identify_subjects, transcription)
+                await identified.put(
+                    (index, start_time, stage_times, audio_file, transcription, transcription_confidence, subjects)
+                )
+            await identified.put(None)
+        
+        async def match_stage():
+            while True:
+                item = await identified.get()
+                if item is None:
+                    break
+                (index, start_time, stage_times, audio_file,
+                 transcription, transcription_confidence, subjects) = item
+                try:
+                    results[index] = await asyncio.to_thread(
+                        self._create_local_file_result,
+                        audio_file, transcription, transcription_confidence, subjects,
+                        max_icons, confidence_threshold, start_time, None, stage_times
+                    )
+                except Exception as e:
+                    results[index] = self._create_local_file_error_result(
+                        audio_file, e, start_time
+                    )
+        
+        stages = [
+            asyncio.ensure_future(stage())
+            for stage in (transcribe_stage, subjects_stage, match_stage)
+        ]
+        try:
+            await asyncio.gather(*stages)
+        finally:
+            # A failed stage leaves the others waiting on its queue forever
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+        return results
+    
+    def _transcribe_local_file(self, audio_file: str) -> Tuple[str, str, float]:
+        """Validate a local audio file and transcribe it (step 1).
+        
+        Args:
+            audio_file: Path to audio file to transcribe
             
-            # Step 2: Identify subjects from transcription
-            logger.info("Step 2: Identifying subjects...")
-            try:
-                subject_result = self.subject_identifier.identify_subjects(transcription)
-                
-                if not subject_result or not subject_result.subjects:
-                    logger.warning("Subject identification produced no results")
-                    subjects = {}
-                else:
-                    # Convert SubjectAnalysisResult to rich dict format (unified method)
-                    subjects = self._convert_subjects_to_rich_dict(subject_result)
-                
-                logger.info(f"Subject identification complete. Found {len(subjects)} subject types")
-                logger.debug(f"Subjects: {subjects}")
-                
-            except Exception as e:
-                logger.error(f"Subject identification failed: {e}")
-                # Continue with empty subjects rather than failing completely
-                subjects = {}
+        Returns:
+            Tuple of (audio file path, transcription, transcription confidence)
             
-            # Use common icon matching and ranking logic
-            ranked_matches = self._match_subjects_to_icons(subjects, max_icons)
-            filtered_matches = self._filter_by_confidence(ranked_matches, confidence_threshold)
+        Raises:
+            AudioIconValidationError: If audio file is invalid
+            AudioIconProcessingError: If transcription fails or produces no text
+        """
+        # Validate input file
+        if not os.path.isfile(audio_file):
+            raise AudioIconValidationError(f"Audio file not found: {audio_file}")
             
-            processing_time = time.time() - start_time
+        logger.info(f"Starting audio-to-icon pipeline for: {audio_file}")
+        
+        content_hash = self._hash_file(audio_file) if self.cache_size else None
+        cached = self._cache_get(self._transcription_cache, content_hash)
+        if cached is not None:
+            logger.debug("Reusing cached transcription for %s", audio_file)
+            return (audio_file, *cached)
+        
+        # Step 1: Extract text from audio
+        logger.debug("Step 1: Extracting text from audio...")
+        audio_result = self.audio_processor.extract_text(audio_file)
+        
+        if not audio_result or not audio_result.text:
+            raise AudioIconProcessingError("Audio processing failed or produced no text")
+        
+        transcription = audio_result.text
+        transcription_confidence = audio_result.confidence
+        self._cache_put(self._transcription_cache, content_hash, (transcription, transcription_confidence))
+        
+        logger.debug("Transcription complete (confidence: %.2f)", transcription_confidence)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Transcribed text: %s...", transcription[:100])
+        
+        return audio_file, transcription, transcription_confidence
+    
+    def _transcribe_and_identify_windowed(
+        self, 
+        audio_file: str,
+        max_icons: int = 10
+    ) -> Tuple[str, str, float, Dict[str, Any], SearchCache]:
+        """Transcribe a local file in windows, identifying subjects as windows arrive.
+        
+        A worker thread transcribes windows into a queue while this thread runs
+        subject identification on each finished window. Subjects found in
+        several windows are merged by name, keeping the highest confidence.
+        After each window, the icon searches for the subjects found so far are
+        prefetched on another worker thread, so database lookups overlap with
+        identification of later windows.
+        
+        With stop_when_stable, transcription ends early once the top max_icons
+        subjects have overlapped by at least _STABLE_SUBJECT_OVERLAP for
+        _STABLE_SUBJECT_WINDOWS windows in a row.
+        
+        Args:
+            audio_file: Path to audio file to process
+            max_icons: Number of leading subjects compared between windows
             
-            logger.info(
-                f"Local file pipeline complete in {processing_time:.2f}s. "
-                f"Returning {len(filtered_matches)} icon matches"
-            )
+        Returns:
+            Tuple of (audio file path, transcription, transcription confidence, rich
+            subjects dict, prefetched icon search results)
             
-            # Create result metadata
-            metadata = {
-                'source_type': 'local_file',
-                'audio_file': str(audio_path),
-                'max_icons_requested': max_icons,
-                'confidence_threshold': confidence_threshold,
-                'total_matches_found': len(ranked_matches),
-                'matches_after_filtering': len(filtered_matches),
-                'pipeline_version': '1.1'
-            }
+        Raises:
+            AudioIconValidationError: If audio file is invalid
+            AudioIconProcessingError: If transcription fails or produces no text
+        """
+        if not os.path.isfile(audio_file):
+            raise AudioIconValidationError(f"Audio file not found: {audio_file}")
+        
+        logger.info(
+            f"Starting windowed audio-to-icon pipeline for: {audio_file} "
+            f"({self.transcription_window_seconds}s windows)"
+        )
+        
+        windows: queue.Queue = queue.Queue(maxsize=2)
+        finished = object()
+        stop = threading.Event()
+        
+        def transcribe_windows():
+            try:
+                for window in self.audio_processor.extract_text_windows(
+                    audio_file, self.transcription_window_seconds
+                ):
+                    if stop.is_set():
+                        break
+                    windows.put(window)
+            except Exception as e:
+                windows.put(e)
+            finally:
+                windows.put(finished)
+        
+        transcriber = threading.Thread(
+            target=transcribe_windows, name="audio-icon-transcriber", daemon=True
+        )
+        transcriber.start()
+        
+        texts: List[str] = []
+        confidences: List[float] = []
+        merged_subjects: Dict[str, Subject] = {}
+        categories = set()
+        transcription_error = None
+        search_cache: SearchCache = {}
+        top_subjects: set = set()
+        stable_windows = 0
+        
+        transcriber_done = False
+        try:
+            # A single prefetch worker keeps the icon service's database session
+            # to one thread at a time; leaving the block waits for it to finish
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-icon-prefetch") as prefetcher:
+                while True:
+                    window = windows.get()
+                    if window is finished:
+                        transcriber_done = True
+                        break
+                    if isinstance(window, Exception):
+                        transcription_error = window
+                        continue
+                    
+                    texts.append(window.text)
+                    confidences.append(window.confidence)
+                    
+                    try:
+                        subject_result = self.subject_identifier.identify_subjects(window.text)
+                    except Exception as e:
+                        logger.warning(f"Subject identification failed for audio window: {e}")
+                        continue
+                    if not subject_result:
+                        continue
+                    
+                    for subject in subject_result.subjects:
+                        key = subject.name.lower()
+                        current = merged_subjects.get(key)
+                        if current is None or subject.confidence > current.confidence:
+                            merged_subjects[key] = subject
+                    categories.update(subject_result.categories)
+                    
+                    if merged_subjects:
+                        partial_subjects = self._convert_subjects_to_rich_dict(SubjectAnalysisResult(
+                            subjects=set(merged_subjects.values()),
+                            categories=set(categories)
+                        ))
+                        prefetcher.submit(self.icon_matcher.prefetch_icons, partial_subjects, search_cache)
+                    
+                    if self.stop_when_stable:
+                        previous, top_subjects = top_subjects, self._top_subject_names(merged_subjects, max_icons)
+                        overlap = len(previous & top_subjects) / len(previous | top_subjects) if previous else 0.0
+                        stable_windows = stable_windows + 1 if overlap >= _STABLE_SUBJECT_OVERLAP else 0
+                        if stable_windows >= _STABLE_SUBJECT_WINDOWS:
+                            logger.debug("Top subjects stable after %d windows, stopping transcription", len(texts))
+                            break
+        finally:
+            if not transcriber_done:
+                # Stopping early or failing leaves the transcriber blocked on a
+                # full queue; windows already queued are dropped
+                stop.set()
+                while windows.get() is not finished:
+                    pass
+            transcriber.join()
+        
+        if transcription_error is not None:
+            raise AudioIconProcessingError(
+                f"Audio processing failed: {transcription_error}"
+            ) from transcription_error
+        if not texts:
+            raise AudioIconProcessingError("Audio processing failed or produced no text")
+        
+        transcription = " ".join(texts)
+        transcription_confidence = sum(confidences) / len(confidences)
+        logger.debug(
+            "Windowed transcription complete: %d windows (confidence: %.2f)",
+            len(texts), transcription_confidence
+        )
+        
+        if merged_subjects:
+            subjects = self._convert_subjects_to_rich_dict(SubjectAnalysisResult(
+                subjects=set(merged_subjects.values()),
+                categories=categories
+            ))
+        else:
+            logger.warning("Subject identification produced no results")
+            subjects = {}
+        
+        return audio_file, transcription, transcription_confidence, subjects, search_cache
+    
+    @staticmethod
+    def _top_subject_names(merged_subjects: Dict[str, Subject], limit: int) -> set:
+        """Get the names of the highest-confidence merged subjects."""
+        ranked = sorted(merged_subjects.items(), key=lambda item: item[1].confidence, reverse=True)
+        return {name for name, _ in ranked[:limit]}
+    
+    def _identify_subjects(self, transcription: str) -> Dict[str, Any]:
+        """Identify subjects in a transcription (step 2).
+        
+        Args:
+            transcription: Transcribed text
             
-            return self._create_success_result(
-                transcription, transcription_confidence, subjects,
-                filtered_matches, processing_time, metadata
-            )
+        Returns:
+            Rich subjects dict, empty if identification fails or finds nothing
+        """
+        cached = self._cache_get(self._subject_cache, transcription if self.cache_size else None)
+        if cached is not None:
+            logger.debug("Reusing cached subjects for transcription")
+            return copy.deepcopy(cached)
+        
+        logger.debug("Step 2: Identifying subjects...")
+        try:
+            subject_result = self.subject_identifier.identify_subjects(transcription)
             
-        except (AudioIconValidationError, AudioIconProcessingError):
-            # Re-raise validation and audio processing errors
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in local file pipeline: {e}")
-            processing_time = time.time() - start_time
+            if not subject_result or not subject_result.subjects:
+                logger.warning("Subject identification produced no results")
+                subjects = {}
+            else:
+                # Convert SubjectAnalysisResult to rich dict format (unified method)
+                subjects = self._convert_subjects_to_rich_dict(subject_result)
+                if self.cache_size:
+                    self._cache_put(self._subject_cache, transcription, copy.deepcopy(subjects))
             
-            # Return error result
-            error_metadata = {
-                'source_type': 'local_file',
-                'audio_file': audio_file,
-                'error_type': type(e).__name__,
-                'pipeline_version': '1.1'
-            }
+            logger.debug("Subject identification complete. Found %d subject types", len(subjects))
+            logger.debug("Subjects: %s", subjects)
             
-            return self._create_error_result(
-                f"Local file pipeline failed: {e}",
-                processing_time,
-                error_metadata
+        except Exception as e:
+            logger.error(f"Subject identification failed: {e}")
+            # Continue with empty subjects rather than failing completely
+            subjects = {}
+        
+        return subjects
+    
+    @staticmethod
+    def _hash_file(audio_file: str) -> str:
+        """Get the SHA-256 hex digest of a file, read in 64 KiB chunks."""
+        digest = hashlib.sha256()
+        with open(audio_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _cache_get(self, cache: OrderedDict, key: Optional[str]) -> Any:
+        """Get a cached value, marking it most recently used, or None on a miss."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, cache: OrderedDict, key: Optional[str], value: Any) -> None:
+        """Store a value, evicting the least recently used entries beyond cache_size."""
+        if key is None:
+            return
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached transcriptions and subject results."""
+        with self._cache_lock:
+            self._transcription_cache.clear()
+            self._subject_cache.clear()
+    
+    def _create_local_file_result(
+        self,
+        audio_file: str,
+        transcription: str,
+        transcription_confidence: float,
+        subjects: Dict[str, Any],
+        max_icons: int,
+        confidence_threshold: float,
+        start_time: float,
+        search_cache: Optional[SearchCache] = None,
+        stage_times: Optional[Dict[str, float]] = None
+    ) -> AudioIconResult:
+        """Match subjects to icons (steps 3 and 4) and build the local file result.
+        
+        Args:
+            audio_file: Path of the processed audio file
+            transcription: Transcribed text
+            transcription_confidence: Confidence of transcription
+            subjects: Identified subjects
+            max_icons: Maximum number of icons to return
+            confidence_threshold: Minimum confidence for icon matches
+            start_time: time.perf_counter() reading when processing of this file started
+            search_cache: Optional icon search results prefetched during windowed
+                subject identification
+            stage_times: Seconds spent in earlier stages, keyed by stage name;
+                icon matching is added and the result stored in the metadata
+            
+        Returns:
+            AudioIconResult for success case
+        """
+        stage_times = dict(stage_times or {})
+        
+        # Use common icon matching and ranking logic
+        with _timed(stage_times, 'icon_matching'):
+            filtered_matches, ranked_count = self._match_subjects_to_icons(
+                subjects, max_icons, search_cache, confidence_threshold
             )
+        
+        processing_time = time.perf_counter() - start_time
+        
+        logger.info(
+            f"Local file pipeline complete in {processing_time:.2f}s. "
+            f"Returning {len(filtered_matches)} icon matches"
+        )
+        
+        # Create result metadata
+        metadata = self._build_metadata(
+            'local_file',
+            audio_file=audio_file,
+            max_icons_requested=max_icons,
+            confidence_threshold=confidence_threshold,
+            total_matches_found=ranked_count,
+            matches_after_filtering=len(filtered_matches),
+            stage_times=stage_times
+        )
+        
+        return self._create_success_result(
+            transcription, transcription_confidence, subjects,
+            filtered_matches, processing_time, metadata
+        )
+    
+    def _create_local_file_error_result(
+        self,
+        audio_file: str,
+        error: Exception,
+        start_time: float
+    ) -> AudioIconResult:
+        """Create the error result for an unexpected local file pipeline failure.
+        
+        Args:
+            audio_file: Path of the audio file being processed
+            error: Exception that stopped processing
+            start_time: time.perf_counter() reading when processing of this file started
+            
+        Returns:
+            AudioIconResult for error case
+        """
+        logger.error(f"Unexpected error in local file pipeline: {error}")
+        processing_time = time.perf_counter() - start_time
+        
+        error_metadata = self._build_metadata(
+            'local_file', audio_file=audio_file, error_type=type(error).__name__
+        )
+        
+        return self._create_error_result(
+            f"Local file pipeline failed: {error}",
+            processing_time,
+            error_metadata
+        )
     
     def validate_audio_file(self, audio_file: str) -> bool:
         """Validate that the audio file can be processed.
@@ -466,6 +1303,9 @@ class AudioIconPipeline:
         Returns:
             True if file is valid, False otherwise
         """
+        # Reject unsupported extensions without touching the audio processor
+        if not validate_extension(audio_file):
+            return False
         try:
             path = self.audio_processor.validate_file(audio_file)
             return path is not None and path.exists()
@@ -473,13 +1313,14 @@ class AudioIconPipeline:
             logger.error(f"Audio file validation failed: {e}")
             return False
     
-    def get_supported_formats(self) -> List[str]:
+    @classmethod
+    def get_supported_formats(cls) -> List[str]:
         """Get list of supported audio formats.
         
         Returns:
-            List of supported file extensions
+            Sorted list of supported file extensions
         """
-        return list(self.audio_processor.SUPPORTED_FORMATS)
+        return list(SORTED_FORMATS)
     
     def _convert_subjects_to_rich_dict(self, subjects_source: Union[SubjectAnalysisResult, List]) -> Dict[str, Any]:
         """Convert subjects to rich dict format with confidence and metadata.
@@ -512,47 +1353,62 @@ class AudioIconPipeline:
         
         # Group subjects by type with rich metadata
         for subject in subjects_list:
-            # Clean up the type field to just show the enum value
-            subject_type_clean = 'KEYWORD'  # Default
-            if hasattr(subject, 'subject_type') and subject.subject_type:
-                if hasattr(subject.subject_type, 'value'):
-                    subject_type_clean = subject.subject_type.value.upper()
-                else:
-                    subject_type_clean = str(subject.subject_type).upper()
+            # Subject always defines these fields, so only other objects are probed
+            if type(subject) is Subject:
+                subject_type, context = subject.subject_type, subject.context
+            else:
+                subject_type = getattr(subject, 'subject_type', None)
+                context = getattr(subject, 'context', None)
             
-            subject_info = {
-                'name': subject.name,
-                'confidence': subject.confidence,
-                'type': subject_type_clean,
-                'context': {}  # Default empty context
-            }
+            # Clean up the type field to just show the enum value, and route to
+            # the appropriate category, defaulting unknown types to keywords
+            route = _SUBJECT_TYPE_ROUTES.get(subject_type)
+            if route is not None:
+                subject_type_clean, bucket = route
+            else:
+                if subject_type:
+                    subject_type_clean = str(getattr(subject_type, 'value', subject_type)).upper()
+                else:
+                    subject_type_clean = 'KEYWORD'  # Default
+                # Plain string types vary ('topics', 'named_entity'), so they
+                # are routed by what they contain
+                subject_type_str = subject_type_clean.lower()
+                if 'keyword' in subject_type_str:
+                    bucket = 'keywords'
+                elif 'topic' in subject_type_str:
+                    bucket = 'topics'
+                elif 'entity' in subject_type_str:
+                    bucket = 'entities'
+                else:
+                    bucket = 'keywords'
             
             # Add context if available
-            if hasattr(subject, 'context') and subject.context:
-                subject_info['context'] = {
-                    'domain': getattr(subject.context, 'domain', None),
-                    'language': getattr(subject.context, 'language', 'en')
+            if not context:
+                context_info = {}
+            elif type(context) is Context:
+                context_info = {'domain': context.domain, 'language': context.language}
+            else:
+                context_info = {
+                    'domain': getattr(context, 'domain', None),
+                    'language': getattr(context, 'language', 'en')
                 }
             
-            # Route to appropriate category based on subject type
-            subject_type_str = subject_type_clean.lower()
-            if 'keyword' in subject_type_str:
-                subjects_dict['keywords'].append(subject_info)
-            elif 'topic' in subject_type_str:
-                subjects_dict['topics'].append(subject_info)
-            elif 'entity' in subject_type_str:
-                subjects_dict['entities'].append(subject_info)
-            else:
-                # Default unknown types to keywords
-                subjects_dict['keywords'].append(subject_info)
+            subjects_dict[bucket].append({
+                'name': subject.name,
+                'confidence': subject.confidence,
+                'type': subject_type_clean,
+                'context': context_info
+            })
         
-        # Add categories with metadata (if available)
-        for category in categories_list:
-            category_info = {
+        # Add categories with metadata (if available); the count is known, so
+        # the list is built in one pass
+        subjects_dict['categories'] = [
+            {
                 'name': str(category.name) if hasattr(category, 'name') else str(category),
                 'id': getattr(category, 'id', None)
             }
-            subjects_dict['categories'].append(category_info)
+            for category in categories_list
+        ]
         
         return subjects_dict
 
@@ -576,29 +1432,65 @@ class AudioIconPipeline:
             logger.error(f"Podcast URL validation failed: {e}")
             return False
     
+    def __enter__(self) -> "AudioIconPipeline":
+        """Enter a context; close() runs on exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Release this pipeline's own resources when leaving a context; see cleanup()."""
+        self.close()
+    
+    async def __aenter__(self) -> "AudioIconPipeline":
+        """Enter an async context; cleanup() runs on exit."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Release this pipeline's own resources when leaving an async context; see cleanup()."""
+        await self.cleanup()
+    
+    def close(self) -> None:
+        """Synchronous version of cleanup(), usable with or without a running event loop.
+        
+        Raises:
+            AudioIconProcessingError: If called from the pipeline's background
+                loop, which would wait on itself
+        """
+        if threading.current_thread() is _BACKGROUND_THREAD:
+            raise AudioIconProcessingError(
+                "Cannot call close() from the pipeline's background event loop. "
+                "Use 'await pipeline.cleanup()' instead."
+            )
+        if self._own_podcast_analyzer() is None:
+            # Nothing to close, so don't start the background loop for it
+            return
+        asyncio.run_coroutine_threadsafe(self.cleanup(), _get_background_loop()).result()
+    
+    def _own_podcast_analyzer(self) -> Optional[PodcastAnalyzer]:
+        """Get the podcast analyzer assigned to this pipeline directly, if it has one to clean up."""
+        # Don't construct the analyzer just to look at it
+        podcast_analyzer = self.__dict__.get('podcast_analyzer')
+        if (
+            podcast_analyzer is None
+            or podcast_analyzer is _MODEL_REGISTRY.get('podcast_analyzer')
+            or not hasattr(podcast_analyzer, 'cleanup')
+        ):
+            return None
+        return podcast_analyzer
+    
     async def cleanup(self):
-        """Cleanup resources used by the pipeline."""
+        """Cleanup resources owned by this pipeline.
+        
+        Processors come from a registry shared by every pipeline in the
+        process, so the shared podcast analyzer's HTTP sessions may be serving
+        another pipeline's request. They are left open for connection reuse
+        and closed at interpreter exit. Only a podcast analyzer assigned to
+        this pipeline directly has its sessions closed here.
+        """
+        podcast_analyzer = self._own_podcast_analyzer()
         try:
-            if hasattr(self.podcast_analyzer, 'cleanup'):
-                await self.podcast_analyzer.cleanup()
+            if podcast_analyzer is not None:
+                # The analyzer's sessions belong to the background loop
+                await self._await_in_background(podcast_analyzer.cleanup())
+                self._cleanup_state['sessions_open'] = False
         except Exception as e:
             logger.warning(f"Error during cleanup: {e}")
-
-    def __del__(self):
-        """Cleanup when pipeline is destroyed."""
-        try:
-            # Only attempt cleanup if there's an event loop available
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If loop is running, schedule cleanup as a task
-                    asyncio.create_task(self.cleanup())
-                else:
-                    # If loop is not running, create new loop to run cleanup
-                    asyncio.run(self.cleanup())
-            except RuntimeError:
-                # No event loop available - this is common during interpreter shutdown
-                pass
-        except Exception:
-            # Ignore all cleanup errors during destruction to avoid issues during shutdown
-            pass
@@ -10,6 +10,9 @@ from icon_extractor.models.icon import IconData
 @dataclass
 class IconMatch:
     """Represents a matched icon with confidence score."""
+    # One is created per candidate icon while matching, so skip the per-instance dict
+    __slots__ = ('icon', 'confidence', 'match_reason', 'subjects_matched')
+    
     icon: IconData
     confidence: float
     match_reason: str
@@ -1,7 +1,14 @@
 """Icon matcher processor for matching subjects to icons."""
 
+import heapq
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, FrozenSet, Iterator, List, Any, Optional, Tuple
 
 from ..core.exceptions import IconMatchingError
 from ..models.results import IconMatch
@@ -12,74 +19,143 @@ from icon_extractor.models.icon import IconData
 
 logger = logging.getLogger(__name__)
 
+# An icon search: (query, category, limit)
+SearchKey = Tuple[str, Optional[str], int]
+
+# Icon search results, shared between IconMatcher.prefetch_icons and a later
+# find_matching_icons call
+SearchCache = Dict[SearchKey, List[IconData]]
+
+# An icon's lowercased (name, name words, description, tags, name and tags
+# joined by newlines), as scored by IconMatcher._calculate_confidence
+LoweredFields = Tuple[str, FrozenSet[str], str, Tuple[str, ...], str]
+
+
+# Confidence boost by lowercased subject type, for subjects with rich metadata
+_SUBJECT_TYPE_BOOSTS = {
+    'entity': 0.13,    # Named entities are very reliable (0.05 base + 0.08 bonus)
+    'ner': 0.13,
+    'keyword': 0.08,   # Keywords are reliable (0.05 base + 0.03 bonus)
+    'keywords': 0.08,
+    'topic': 0.05,     # Topics are moderately reliable (0.03 base + 0.02 bonus)
+    'topics': 0.05,
+}
+
+# Fallback confidence boost by term type when there is no subject type;
+# entities get no fallback boost
+_TERM_TYPE_BOOSTS = {
+    'keyword': 0.05,
+    'topic': 0.03,
+}
+
+
+@lru_cache(maxsize=256)
+def _domain_words(domain: str) -> Tuple[str, ...]:
+    """Split a context domain into lowercased words, once per distinct domain."""
+    return tuple(domain.lower().split())
+
 
 class IconMatcher:
     """Matches subjects to icons using the icon database."""
     
-    def __init__(self):
-        """Initialize the icon matcher with icon service."""
+    # Default floor below which scored (term, icon) pairs are dropped
+    MIN_KEEP_CONFIDENCE = 0.0
+    
+    def __init__(
+        self, 
+        search_workers: int = 1, 
+        bulk_search: bool = False, 
+        search_cache_size: int = 0,
+        min_confidence: Optional[float] = None,
+        search_cache_ttl: Optional[float] = None
+    ):
+        """Initialize the icon matcher with icon service.
+        
+        Args:
+            search_workers: Number of threads that run icon searches
+                concurrently, one search per task. Each thread uses its own
+                IconService and closes its database session after every
+                search, unless icon_service was replaced, in which case the
+                workers share it like any other thread. 1 runs every search
+                on icon_service in the calling thread.
+            bulk_search: Fetch every term and category search through one
+                IconService.search_icons_bulk call, so a match costs a single
+                database round-trip instead of one per term and category.
+                With both set, the worker threads only run the searches a
+                failed bulk search left out.
+            search_cache_size: Number of icon search results to keep across
+                find_matching_icons calls, keyed by (query, category, limit)
+                with the query lowercased, as searches are case-insensitive.
+                0 disables the cache.
+            min_confidence: Scored (term, icon) pairs below this confidence
+                are dropped before deduplication and sorting. Defaults to
+                MIN_KEEP_CONFIDENCE, which keeps every pair; ResultRanker can
+                raise a match's confidence afterwards, so a floor should sit
+                below the threshold applied to ranked results.
+            search_cache_ttl: Seconds a search result is kept across calls
+                before it is searched again. None keeps results until they
+                are evicted or clear_search_cache is called.
+        """
         self.icon_service = IconService()
+        self.search_workers = search_workers
+        self.bulk_search = bulk_search
+        self.search_cache_size = search_cache_size
+        self.min_confidence = self.MIN_KEEP_CONFIDENCE if min_confidence is None else min_confidence
+        self.search_cache_ttl = search_cache_ttl
+        # Kept search results with the time.monotonic() they were stored at
+        self._recent_searches: "OrderedDict[SearchKey, Tuple[float, Tuple[IconData, ...]]]" = OrderedDict()
+        self._recent_searches_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._thread_state = threading.local()
+        # IconService holds a database session, which is not thread-safe, so
+        # a matcher shared between pipelines takes turns on icon_service
+        self._icon_service_lock = threading.Lock()
+        self._default_icon_service = self.icon_service
         
     def find_matching_icons(
         self, 
         subjects: Dict[str, Any], 
-        limit: int = 10
+        limit: int = 10,
+        search_cache: Optional[SearchCache] = None
     ) -> List[IconMatch]:
         """Find icons that match the identified subjects.
         
         Args:
             subjects: Subject identification results
             limit: Maximum number of icon matches to return
+            search_cache: Optional search results from prefetch_icons; searches
+                found there are not sent to the icon service again. Without
+                one, a cache for this call is used, so a term that appears in
+                several subject groups is only searched once.
             
         Returns:
             List of IconMatch objects sorted by confidence
         """
         try:
-            icon_matches = []
+            if search_cache is None:
+                search_cache = {}
             
-            # Extract different types of subjects
-            keywords = subjects.get('keywords', [])
-            topics = subjects.get('topics', [])
-            entities = subjects.get('entities', [])
-            categories = subjects.get('categories', [])
-            
-            # Search for icons using different subject types
-            search_terms = []
+            if self.bulk_search:
+                self._search_bulk(subjects, search_cache)
+            if self.search_workers > 1:
+                # Also picks up anything a failed bulk search left out
+                self._search_concurrently(subjects, search_cache)
             
-            # Add keywords (rich metadata format)
-            for keyword in keywords:
-                confidence = keyword.get('confidence', 0)
-                name = keyword.get('name', str(keyword))
-                keyword_type = keyword.get('type', 'KEYWORD')
-                context = keyword.get('context', {})
-                
-                if confidence > 0.5:  # Quality threshold
-                    search_terms.append((name, 'keyword', confidence, keyword_type, context))
-                    
-            # Add topics (rich metadata format)
-            for topic in topics:
-                name = topic.get('name', str(topic))
-                confidence = topic.get('confidence', 0.7)
-                topic_type = topic.get('type', 'TOPIC')
-                context = topic.get('context', {})
-                search_terms.append((name, 'topic', confidence, topic_type, context))
-                    
-            # Add entities (rich metadata format)
-            for entity in entities:
-                name = entity.get('name', str(entity))
-                confidence = entity.get('confidence', 0.6)
-                entity_type = entity.get('type', 'ENTITY')
-                context = entity.get('context', {})
-                search_terms.append((name, 'entity', confidence, entity_type, context))
+            # Matches keyed by icon URL, in first-seen order
+            matches_by_url: Dict[str, IconMatch] = {}
+            # Lowercased fields and download counts of each icon scored in
+            # this call, keyed by id(); search_cache keeps the icons alive
+            # until it returns
+            lowered_by_icon: Dict[int, LoweredFields] = {}
+            downloads_by_icon: Dict[int, int] = {}
+            categories = subjects.get('categories', [])
             
             # Search for icons using each search term (unified rich format)
-            for term, term_type, base_confidence, subject_type, context in search_terms:
+            for term, term_type, base_confidence, subject_type, context in self._build_search_terms(subjects):
                 try:
                     # Search icons by term
-                    icons = self.icon_service.search_icons(
-                        query=term,
-                        limit=5  # Limit per search term
-                    )
+                    icons = self._search_icons(term, None, 5, search_cache)  # Limit per search term
                     
                     # Also try category-based search if we have categories
                     category_icons = []
@@ -87,28 +163,38 @@ class IconMatcher:
                         for category in categories:
                             category_str = category if isinstance(category, str) else str(category)
                             category_icons.extend(
-                                self.icon_service.search_icons(
-                                    query=term,
-                                    category=category_str,
-                                    limit=3
-                                )
+                                self._search_icons(term, category_str, 3, search_cache)
                             )
                     
                     # Combine results
                     all_icons = icons + category_icons
+                    term_lower = term.lower()
                     
-                    # Create IconMatch objects
+                    # Create IconMatch objects; an icon returned by several of
+                    # this term's searches scores the same each time, so only
+                    # its first occurrence can change the matches
+                    scored_urls = set()
                     for icon in all_icons:
+                        if icon.url in scored_urls:
+                            continue
+                        scored_urls.add(icon.url)
+                        
+                        lowered_fields = lowered_by_icon.get(id(icon))
+                        if lowered_fields is None:
+                            lowered_fields = lowered_by_icon[id(icon)] = self._lowered_fields(icon)
+                            downloads_by_icon[id(icon)] = self._download_count(icon)
+                        
                         # Calculate confidence with rich metadata support
                         confidence = self._calculate_confidence(
-                            term, icon, term_type, base_confidence, subject_type, context
+                            term, icon, term_type, base_confidence, subject_type, context,
+                            term_lower=term_lower, lowered_fields=lowered_fields,
+                            downloads=downloads_by_icon[id(icon)]
                         )
+                        if confidence < self.min_confidence:
+                            continue
                         
                         # Avoid duplicates
-                        existing_match = next(
-                            (m for m in icon_matches if m.icon.url == icon.url), 
-                            None
-                        )
+                        existing_match = matches_by_url.get(icon.url)
                         
                         if existing_match:
                             # Update existing match with higher confidence
@@ -123,20 +209,310 @@ class IconMatcher:
                                 match_reason=f"Matched {term_type}: {term}",
                                 subjects_matched=[term]
                             )
-                            icon_matches.append(match)
+                            matches_by_url[icon.url] = match
                             
                 except Exception as e:
                     logger.warning(f"Failed to search icons for term '{term}': {e}")
                     continue
             
-            # Sort by confidence and limit results
-            icon_matches.sort(key=lambda x: x.confidence, reverse=True)
-            return icon_matches[:limit]
+            # Top matches by confidence; ties keep first-seen order, as a
+            # stable sort would
+            return heapq.nlargest(limit, matches_by_url.values(), key=attrgetter('confidence'))
             
         except Exception as e:
             logger.error(f"Icon matching failed: {e}")
             raise IconMatchingError(f"Failed to find matching icons: {e}") from e
     
+    def prefetch_icons(self, subjects: Dict[str, Any], search_cache: SearchCache) -> None:
+        """Run the icon searches find_matching_icons would issue for these subjects.
+        
+        Results are stored in search_cache so a later find_matching_icons call
+        with the same cache skips those database round-trips. Searches already
+        in the cache are not repeated, and failed searches are left for
+        find_matching_icons to retry.
+        
+        Args:
+            subjects: Subject identification results (possibly partial)
+            search_cache: Cache to fill with search results
+        """
+        if self.bulk_search:
+            self._search_bulk(subjects, search_cache)
+        
+        for term, category, per_search_limit in self._search_keys(subjects):
+            try:
+                self._search_icons(term, category, per_search_limit, search_cache)
+            except Exception as e:
+                logger.debug(f"Icon prefetch failed for term '{term}': {e}")
+    
+    def _search_keys(self, subjects: Dict[str, Any]) -> Iterator[Tuple[str, Optional[str], int]]:
+        """Yield the (query, category, limit) searches find_matching_icons issues."""
+        categories = [
+            category if isinstance(category, str) else str(category)
+            for category in subjects.get('categories', [])
+        ]
+        
+        for term, *_ in self._build_search_terms(subjects):
+            yield term, None, 5
+            for category in categories:
+                yield term, category, 3
+    
+    def _search_concurrently(self, subjects: Dict[str, Any], search_cache: SearchCache) -> None:
+        """Fill search_cache by running every pending search on the worker threads.
+        
+        Each (term, category, limit) search is its own task, so up to
+        search_workers database round-trips overlap. Scoring and merging stay
+        sequential in find_matching_icons, so results match a single-threaded
+        run. Failed searches are left out so find_matching_icons retries and
+        reports them.
+        
+        Args:
+            subjects: Subject identification results
+            search_cache: Cache to fill with search results
+        """
+        futures = {}
+        for key in self._search_keys(subjects):
+            if key in search_cache or key in futures:
+                continue
+            icons = self._get_recent_search(key)
+            if icons is not None:
+                search_cache[key] = icons
+            else:
+                futures[key] = self._get_executor().submit(self._search_on_worker, key)
+        
+        for key, future in futures.items():
+            icons = future.result()
+            if icons is not None:
+                search_cache[key] = icons
+    
+    def _search_bulk(self, subjects: Dict[str, Any], search_cache: SearchCache) -> None:
+        """Fill search_cache with one bulk search covering every pending search.
+        
+        Searches already in the cache are skipped. If the bulk search fails,
+        its searches are left out, so they fall back to single searches that
+        retry and report each term's error.
+        
+        Args:
+            subjects: Subject identification results
+            search_cache: Cache to fill with search results
+        """
+        pending: List[SearchKey] = []
+        for key in self._search_keys(subjects):
+            if key in search_cache:
+                continue
+            icons = self._get_recent_search(key)
+            if icons is not None:
+                search_cache[key] = icons
+            else:
+                pending.append(key)
+        
+        if not pending:
+            return
+        try:
+            with self._icon_service_lock:
+                icons_by_search = self.icon_service.search_icons_bulk(pending)
+        except Exception as e:
+            logger.debug(f"Bulk icon search failed, searching terms one at a time: {e}")
+            return
+        
+        for key in pending:
+            search_cache[key] = icons_by_search.get(key, [])
+            self._remember_search(key, search_cache[key])
+    
+    def _get_thread_icon_service(self) -> IconService:
+        """Get the calling worker thread's icon service, creating it on first use."""
+        icon_service = getattr(self._thread_state, 'icon_service', None)
+        if icon_service is None:
+            icon_service = self._thread_state.icon_service = IconService()
+        return icon_service
+    
+    def _search_on_worker(self, key: SearchKey) -> Optional[List[IconData]]:
+        """Run one search with this worker thread's icon service, or return None if it fails."""
+        try:
+            if self.icon_service is not self._default_icon_service:
+                with self._icon_service_lock:
+                    icons = self._run_search(self.icon_service, *key)
+            else:
+                icon_service = self._get_thread_icon_service()
+                try:
+                    icons = self._run_search(icon_service, *key)
+                finally:
+                    # Idle workers must not hold a pooled connection
+                    icon_service.repository.close()
+        except Exception as e:
+            logger.debug(f"Concurrent icon search failed for term '{key[0]}': {e}")
+            return None
+        self._remember_search(key, icons)
+        return icons
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the search thread pool, starting it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.search_workers,
+                    thread_name_prefix="icon-search"
+                )
+            return self._executor
+    
+    def _build_search_terms(
+        self, 
+        subjects: Dict[str, Any]
+    ) -> List[Tuple[str, str, float, str, Dict[str, Any]]]:
+        """Collect the search terms for keywords, topics and entities.
+        
+        Args:
+            subjects: Subject identification results
+            
+        Returns:
+            List of (term, term_type, base_confidence, subject_type, context) tuples
+        """
+        search_terms = []
+        
+        # Add keywords (rich metadata format)
+        for keyword in subjects.get('keywords', []):
+            confidence = keyword.get('confidence', 0)
+            name = keyword.get('name', str(keyword))
+            keyword_type = keyword.get('type', 'KEYWORD')
+            context = keyword.get('context', {})
+            
+            if confidence > 0.5:  # Quality threshold
+                search_terms.append((name, 'keyword', confidence, keyword_type, context))
+                
+        # Add topics (rich metadata format)
+        for topic in subjects.get('topics', []):
+            name = topic.get('name', str(topic))
+            confidence = topic.get('confidence', 0.7)
+            topic_type = topic.get('type', 'TOPIC')
+            context = topic.get('context', {})
+            search_terms.append((name, 'topic', confidence, topic_type, context))
+                
+        # Add entities (rich metadata format)
+        for entity in subjects.get('entities', []):
+            name = entity.get('name', str(entity))
+            confidence = entity.get('confidence', 0.6)
+            entity_type = entity.get('type', 'ENTITY')
+            context = entity.get('context', {})
+            search_terms.append((name, 'entity', confidence, entity_type, context))
+        
+        return search_terms
+    
+    def _search_icons(
+        self, 
+        term: str, 
+        category: Optional[str], 
+        limit: int,
+        search_cache: Optional[SearchCache] = None
+    ) -> List[IconData]:
+        """Search the icon service, reusing a cached result when available.
+        
+        Args:
+            term: Search query
+            category: Category to restrict the search to, if any
+            limit: Maximum number of icons to return
+            search_cache: Optional cache of earlier search results
+            
+        Returns:
+            List of matching icons
+        """
+        key = (term, category, limit)
+        if search_cache is not None and key in search_cache:
+            return search_cache[key]
+        
+        icons = self._get_recent_search(key)
+        if icons is None:
+            with self._icon_service_lock:
+                icons = self._run_search(self.icon_service, term, category, limit)
+            self._remember_search(key, icons)
+        
+        if search_cache is not None:
+            search_cache[key] = icons
+        return icons
+    
+    def _get_recent_search(self, key: SearchKey) -> Optional[List[IconData]]:
+        """Get a search result kept from an earlier call, or None on a miss or once it has expired."""
+        if not self.search_cache_size:
+            return None
+        term, category, limit = key
+        cache_key = (term.lower(), category, limit)
+        with self._recent_searches_lock:
+            entry = self._recent_searches.get(cache_key)
+            if entry is None:
+                return None
+            stored_at, icons = entry
+            if self.search_cache_ttl is not None and time.monotonic() - stored_at > self.search_cache_ttl:
+                del self._recent_searches[cache_key]
+                return None
+            self._recent_searches.move_to_end(cache_key)
+        return list(icons)
+    
+    def _remember_search(self, key: SearchKey, icons: List[IconData]) -> None:
+        """Keep a search result, evicting the least recently used beyond search_cache_size."""
+        if not self.search_cache_size:
+            return
+        term, category, limit = key
+        cache_key = (term.lower(), category, limit)
+        with self._recent_searches_lock:
+            self._recent_searches[cache_key] = (time.monotonic(), tuple(icons))
+            self._recent_searches.move_to_end(cache_key)
+            while len(self._recent_searches) > self.search_cache_size:
+                self._recent_searches.popitem(last=False)
+    
+    def clear_search_cache(self) -> None:
+        """Drop all search results kept across calls, e.g. after the icon database changes."""
+        with self._recent_searches_lock:
+            self._recent_searches.clear()
+    
+    @staticmethod
+    def _run_search(
+        icon_service: IconService, 
+        term: str, 
+        category: Optional[str], 
+        limit: int
+    ) -> List[IconData]:
+        """Issue one icon search, passing a category only when there is one."""
+        if category is None:
+            return icon_service.search_icons(query=term, limit=limit)
+        return icon_service.search_icons(query=term, category=category, limit=limit)
+    
+    @staticmethod
+    def _lowered_fields(icon: IconData) -> LoweredFields:
+        """Get an icon's lowercased name, name words, description and tags.
+        
+        An icon is scored once per search term it is returned for, so
+        find_matching_icons computes these once per icon and call.
+        
+        Returns:
+            Tuple of (name, set of name words, description or '', tags, name
+            and tags joined by newlines). Tags stay a tuple, as repeated exact
+            tag matches each add to the score.
+        """
+        name_lower = icon.name.lower()
+        tags_lower = tuple(tag.lower() for tag in icon.tags) if icon.tags else ()
+        return (
+            name_lower,
+            frozenset(name_lower.split()),
+            icon.description.lower() if icon.description else '',
+            tags_lower,
+            '\n'.join((name_lower,) + tags_lower)
+        )
+    
+    @staticmethod
+    def _download_count(icon: IconData) -> int:
+        """Get an icon's num_downloads as an integer.
+        
+        find_matching_icons parses this once per icon and call.
+        
+        Returns:
+            Download count, or 0 when it is missing or not a number
+        """
+        raw = icon.metadata.get('num_downloads') if icon.metadata else None
+        if raw and isinstance(raw, (int, str)):
+            try:
+                return int(str(raw).replace(',', ''))
+            except ValueError:
+                pass
+        return 0
+    
     def _calculate_confidence(
         self, 
         term: str, 
@@ -144,7 +520,10 @@ class IconMatcher:
         term_type: str, 
         base_confidence: float,
         subject_type: Optional[str] = None,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        term_lower: Optional[str] = None,
+        lowered_fields: Optional[LoweredFields] = None,
+        downloads: Optional[int] = None
     ) -> float:
         """Calculate confidence score for icon match with rich metadata support.
         
@@ -158,6 +537,12 @@ class IconMatcher:
             base_confidence: Base confidence from subject identification
             subject_type: Enhanced subject type (KEYWORD, ENTITY, TOPIC, etc.)
             context: Additional context information (domain, language, etc.)
+            term_lower: Term already lowercased, for callers scoring one term
+                against many icons; computed from term when omitted
+            lowered_fields: The icon's _lowered_fields, for callers scoring
+                one icon against many terms; computed when omitted
+            downloads: The icon's _download_count, likewise; parsed from its
+                metadata when omitted
             
         Returns:
             Calculated confidence score (0.0-1.0)
@@ -165,46 +550,42 @@ class IconMatcher:
         confidence = base_confidence * 0.8  # Start with 80% of base confidence
         
         # Core matching boosts
-        term_lower = term.lower()
+        if term_lower is None:
+            term_lower = term.lower()
+        if lowered_fields is None:
+            lowered_fields = self._lowered_fields(icon)
+        name_lower, name_words, description_lower, tags_lower, name_and_tags = lowered_fields
         
         # Boost for exact name matches
-        if term_lower in icon.name.lower():
+        if term_lower in name_lower:
             confidence += 0.2
             
+        # Tags containing the term, found in one pass for all tag boosts
+        matching_tags = [tag for tag in tags_lower if term_lower in tag]
+        
         # Boost for tag matches
-        if icon.tags and any(term_lower in tag.lower() for tag in icon.tags):
+        if matching_tags:
             confidence += 0.15
             
         # Boost for description matches
-        if icon.description and term_lower in icon.description.lower():
+        if description_lower and term_lower in description_lower:
             confidence += 0.1
             
-        # Enhanced subject type scoring (if rich metadata available)
+        # Enhanced subject type scoring (if rich metadata available), falling
+        # back to basic term type scoring
         if subject_type:
-            subject_type_lower = subject_type.lower()
-            if subject_type_lower in ['entity', 'ner']:
-                confidence += 0.13  # Named entities are very reliable (0.05 base + 0.08 bonus)
-            elif subject_type_lower in ['keyword', 'keywords']:
-                confidence += 0.08  # Keywords are reliable (0.05 base + 0.03 bonus)
-            elif subject_type_lower in ['topic', 'topics']:
-                confidence += 0.05  # Topics are moderately reliable (0.03 base + 0.02 bonus)
+            confidence += _SUBJECT_TYPE_BOOSTS.get(subject_type.lower(), 0.0)
         else:
-            # Fallback to basic term type scoring
-            if term_type == 'keyword':
-                confidence += 0.05
-            elif term_type == 'topic':
-                confidence += 0.03
-            # Entities get no fallback boost
+            confidence += _TERM_TYPE_BOOSTS.get(term_type, 0.0)
         
         # Context-based enhancements (if rich metadata available)
         if context:
             domain = context.get('domain')
             language = context.get('language', 'en')
             
-            # Boost for relevant domain matching
-            if domain and any(domain_word in icon.name.lower() or 
-                            (icon.tags and any(domain_word in tag.lower() for tag in icon.tags))
-                            for domain_word in domain.lower().split()):
+            # Boost for relevant domain matching; domain words hold no
+            # newlines, so a hit in the joined text is a hit in one field
+            if domain and any(domain_word in name_and_tags for domain_word in _domain_words(domain)):
                 confidence += 0.05
             
             # Language consistency boost
@@ -212,34 +593,27 @@ class IconMatcher:
                 confidence += 0.02
         
         # Enhanced exact matching
-        if icon.name.lower() == term_lower:
+        if name_lower == term_lower:
             confidence += 0.15  # Exact name match is very strong
-        elif term_lower in icon.name.lower().split():
+        elif term_lower in name_words:
             confidence += 0.12  # Word match in name
         
-        # Enhanced tag matching
-        if icon.tags:
-            exact_tag_matches = sum(1 for tag in icon.tags if tag.lower() == term_lower)
+        # Enhanced tag matching; an exact tag match is also a partial one
+        if matching_tags:
+            exact_tag_matches = matching_tags.count(term_lower)
             if exact_tag_matches > 0:
                 confidence += 0.10 * min(exact_tag_matches, 3)  # Cap at 3 tag matches
             else:
                 # Partial tag matches
-                partial_matches = sum(1 for tag in icon.tags if term_lower in tag.lower())
-                if partial_matches > 0:
-                    confidence += 0.05 * min(partial_matches, 2)  # Cap at 2 partial matches
+                confidence += 0.05 * min(len(matching_tags), 2)  # Cap at 2 partial matches
         
         # Boost for popular icons (if num_downloads available)
-        if (icon.metadata and 
-            icon.metadata.get('num_downloads') and 
-            isinstance(icon.metadata['num_downloads'], (int, str))):
-            try:
-                downloads = int(str(icon.metadata['num_downloads']).replace(',', ''))
-                if downloads > 1000:
-                    confidence += 0.05
-                elif downloads > 500:
-                    confidence += 0.03
-            except (ValueError, TypeError):
-                pass
+        if downloads is None:
+            downloads = self._download_count(icon)
+        if downloads > 1000:
+            confidence += 0.05
+        elif downloads > 500:
+            confidence += 0.03
         
         # Cap at 1.0
         return min(confidence, 1.0)
@@ -1,7 +1,8 @@
 """Result ranker for ranking and filtering icon results."""
 
 import logging
-from typing import Dict, List, Any
+from operator import attrgetter
+from typing import Dict, List, Any, Optional, Tuple
 
 from ..models.results import IconMatch
 
@@ -15,7 +16,8 @@ class ResultRanker:
         self, 
         icon_matches: List[IconMatch], 
         subjects: Dict[str, Any],
-        limit: int = 10
+        limit: int = 10,
+        min_confidence: float = 0.0
     ) -> List[IconMatch]:
         """Rank icon matches and return top results.
         
@@ -23,28 +25,56 @@ class ResultRanker:
             icon_matches: List of icon matches to rank
             subjects: Original subject identification results
             limit: Maximum number of results to return
+            min_confidence: Matches whose adjusted confidence is below this
+                are dropped before sorting
             
         Returns:
             Ranked list of IconMatch objects
         """
-        # Apply additional ranking criteria
+        if not icon_matches:
+            return []
+        
+        # Category names are the same for every match, so lowercase them once
+        category_names = self._category_names(subjects)
+        
+        # Apply additional ranking criteria, keeping only matches that clear the threshold
+        kept_matches = []
         for match in icon_matches:
-            match.confidence = self._adjust_confidence(match, subjects)
+            match.confidence = self._adjust_confidence(match, subjects, category_names)
+            if match.confidence >= min_confidence:
+                kept_matches.append(match)
         
         # Sort by confidence (descending) and return top results
-        ranked_matches = sorted(icon_matches, key=lambda x: x.confidence, reverse=True)
-        return ranked_matches[:limit]
+        kept_matches.sort(key=attrgetter('confidence'), reverse=True)
+        return kept_matches[:limit]
+    
+    @staticmethod
+    def _category_names(subjects: Dict[str, Any]) -> Tuple[str, ...]:
+        """Get the lowercased category names from subject identification results."""
+        return tuple(
+            (category if isinstance(category, str) else str(category)).lower()
+            for category in subjects.get('categories', [])
+        )
     
-    def _adjust_confidence(self, match: IconMatch, subjects: Dict[str, Any]) -> float:
+    def _adjust_confidence(
+        self,
+        match: IconMatch,
+        subjects: Dict[str, Any],
+        category_names: Optional[Tuple[str, ...]] = None
+    ) -> float:
         """Adjust confidence based on additional criteria.
         
         Args:
             match: Icon match to adjust
             subjects: Subject identification results
+            category_names: Lowercased category names, if already computed
             
         Returns:
             Adjusted confidence score
         """
+        if category_names is None:
+            category_names = self._category_names(subjects)
+        
         confidence = match.confidence
         
         # Boost for multiple subject matches
@@ -52,13 +82,10 @@ class ResultRanker:
             confidence += 0.1
         
         # Boost for category alignment
-        categories = subjects.get('categories', [])
-        if categories and match.icon.category:
-            for category in categories:
-                category_str = category if isinstance(category, str) else str(category)
-                if category_str.lower() in match.icon.category.lower():
-                    confidence += 0.08
-                    break
+        if category_names and match.icon.category:
+            icon_category = match.icon.category.lower()
+            if any(name in icon_category for name in category_names):
+                confidence += 0.08
         
         # Slight penalty for very generic icons (fewer than 3 tags)
         if not match.icon.tags or len(match.icon.tags) < 3:
@@ -13,6 +13,7 @@ from audio_icon_matcher.cli.main import (
     list_supported_formats,
     show_info,
     _output_results,
+    _get_formatter,
     _format_json_output,
     _format_table_output,
     _format_summary_output
@@ -44,10 +45,10 @@ class TestCLICommands:
         self.mock_pipeline.validate_podcast_url.return_value = True
         self.mock_pipeline.get_supported_formats.return_value = ['mp3', 'wav', 'm4a']
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_find_icons_local_file_success(self, mock_pipeline_class):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_find_icons_local_file_success(self, mock_get_pipeline):
         """Test find-icons command with local file."""
-        mock_pipeline_class.return_value = self.mock_pipeline
+        mock_get_pipeline.return_value = self.mock_pipeline
         
         with self.runner.isolated_filesystem():
             # Create a test file
@@ -62,10 +63,10 @@ class TestCLICommands:
             assert "Finding icons for audio file: test.mp3" in result.output
             self.mock_pipeline.process.assert_called_once()
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_find_icons_podcast_url_success(self, mock_pipeline_class):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_find_icons_podcast_url_success(self, mock_get_pipeline):
         """Test find-icons command with podcast URL."""
-        mock_pipeline_class.return_value = self.mock_pipeline
+        mock_get_pipeline.return_value = self.mock_pipeline
         
         result = self.runner.invoke(
             audio_icon_matcher_commands,
@@ -76,10 +77,10 @@ class TestCLICommands:
         assert "Finding icons for podcast episode" in result.output
         self.mock_pipeline.process.assert_called_once()
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_find_icons_file_not_found(self, mock_pipeline_class):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_find_icons_file_not_found(self, mock_get_pipeline):
         """Test find-icons command with non-existent file."""
-        mock_pipeline_class.return_value = self.mock_pipeline
+        mock_get_pipeline.return_value = self.mock_pipeline
         
         result = self.runner.invoke(
             audio_icon_matcher_commands,
@@ -88,12 +89,28 @@ class TestCLICommands:
         
         assert result.exit_code == 1
         assert "Audio file not found" in result.output
+        mock_get_pipeline.assert_not_called()
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_find_icons_invalid_podcast_url(self, mock_pipeline_class):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_find_icons_unsupported_format(self, mock_get_pipeline):
+        """Test find-icons command rejects unsupported formats before building the pipeline."""
+        with self.runner.isolated_filesystem():
+            Path('notes.txt').touch()
+            
+            result = self.runner.invoke(
+                audio_icon_matcher_commands,
+                ['find-icons', 'notes.txt']
+            )
+            
+            assert result.exit_code == 1
+            assert "Unsupported audio format" in result.output
+            mock_get_pipeline.assert_not_called()
+    
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_find_icons_invalid_podcast_url(self, mock_get_pipeline):
         """Test find-icons command with invalid podcast URL."""
         self.mock_pipeline.validate_podcast_url.return_value = False
-        mock_pipeline_class.return_value = self.mock_pipeline
+        mock_get_pipeline.return_value = self.mock_pipeline
         
         result = self.runner.invoke(
             audio_icon_matcher_commands,
@@ -103,10 +120,10 @@ class TestCLICommands:
         assert result.exit_code == 1
         assert "Invalid or unsupported podcast URL" in result.output
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_find_icons_with_options(self, mock_pipeline_class):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_find_icons_with_options(self, mock_get_pipeline):
         """Test find-icons command with custom options."""
-        mock_pipeline_class.return_value = self.mock_pipeline
+        mock_get_pipeline.return_value = self.mock_pipeline
         
         with self.runner.isolated_filesystem():
             Path('test.wav').touch()
@@ -125,13 +142,70 @@ class TestCLICommands:
             self.mock_pipeline.process.assert_called_once_with(
                 'test.wav',
                 max_icons=5,
-                confidence_threshold=0.5
+                confidence_threshold=0.5,
+                episode_index=0,
+                episode_title=None
+            )
+    
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_find_icons_stream(self, mock_get_pipeline):
+        """Test find-icons --stream prints each stage as it arrives."""
+        icon = Mock()
+        icon.name = "Cat Icon"
+        icon.url = "https://example.com/cat.svg"
+        icon.category = None
+        icon.tags = []
+        match = IconMatch(icon=icon, confidence=0.8, match_reason="keyword", subjects_matched=["cat"])
+        self.mock_pipeline.process_streaming.return_value = iter([
+            ("transcription", "Test transcription"),
+            ("subjects", self.mock_result.subjects),
+            ("icon_match", match),
+            ("result", self.mock_result)
+        ])
+        mock_get_pipeline.return_value = self.mock_pipeline
+        
+        with self.runner.isolated_filesystem():
+            Path('test.mp3').touch()
+            
+            result = self.runner.invoke(
+                audio_icon_matcher_commands,
+                ['find-icons', 'test.mp3', '--stream']
+            )
+            
+            assert result.exit_code == 0
+            assert "Transcription: Test transcription" in result.output
+            assert "Subjects identified: 1 keywords" in result.output
+            assert "1. Cat Icon" in result.output
+            assert "Processing Time: 1.50s" in result.output
+            self.mock_pipeline.process.assert_not_called()
+    
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_find_icons_stream_json_lines(self, mock_get_pipeline):
+        """Test find-icons --stream with JSON output emits one object per event."""
+        self.mock_pipeline.process_streaming.return_value = iter([
+            ("transcription", "Test transcription"),
+            ("subjects", self.mock_result.subjects),
+            ("result", self.mock_result)
+        ])
+        mock_get_pipeline.return_value = self.mock_pipeline
+        
+        with self.runner.isolated_filesystem():
+            Path('test.mp3').touch()
+            
+            result = self.runner.invoke(
+                audio_icon_matcher_commands,
+                ['find-icons', 'test.mp3', '--stream', '--output-format', 'json']
             )
+            
+            assert result.exit_code == 0
+            json_lines = [json.loads(line) for line in result.output.splitlines() if line.startswith('{')]
+            assert [line["event"] for line in json_lines] == ["transcription", "subjects", "result"]
+            assert json_lines[-1]["success"] is True
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_find_icons_output_to_file(self, mock_pipeline_class):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_find_icons_output_to_file(self, mock_get_pipeline):
         """Test find-icons command with file output."""
-        mock_pipeline_class.return_value = self.mock_pipeline
+        mock_get_pipeline.return_value = self.mock_pipeline
         
         with self.runner.isolated_filesystem():
             Path('test.mp3').touch()
@@ -149,11 +223,11 @@ class TestCLICommands:
             assert "Results written to results.json" in result.output
             assert Path('results.json').exists()
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_find_icons_processing_error(self, mock_pipeline_class):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_find_icons_processing_error(self, mock_get_pipeline):
         """Test find-icons command with processing error."""
         self.mock_pipeline.process.side_effect = AudioIconProcessingError("Processing failed")
-        mock_pipeline_class.return_value = self.mock_pipeline
+        mock_get_pipeline.return_value = self.mock_pipeline
         
         with self.runner.isolated_filesystem():
             Path('test.mp3').touch()
@@ -166,23 +240,26 @@ class TestCLICommands:
             assert result.exit_code == 1
             assert "Processing Error" in result.output
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_validate_command_local_file_valid(self, mock_pipeline_class):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_validate_command_local_file_valid(self, mock_get_pipeline):
         """Test validate command with valid local file."""
-        mock_pipeline_class.return_value = self.mock_pipeline
-        
-        result = self.runner.invoke(
-            audio_icon_matcher_commands,
-            ['validate', 'test.mp3']
-        )
+        with self.runner.isolated_filesystem():
+            Path('test.mp3').touch()
+            
+            result = self.runner.invoke(
+                audio_icon_matcher_commands,
+                ['validate', 'test.mp3']
+            )
         
         assert result.exit_code == 0
         assert "✅ Valid audio file" in result.output
+        # Local files are validated without constructing the pipeline
+        mock_get_pipeline.assert_not_called()
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_validate_command_podcast_url_valid(self, mock_pipeline_class):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_validate_command_podcast_url_valid(self, mock_get_pipeline):
         """Test validate command with valid podcast URL."""
-        mock_pipeline_class.return_value = self.mock_pipeline
+        mock_get_pipeline.return_value = self.mock_pipeline
         
         result = self.runner.invoke(
             audio_icon_matcher_commands,
@@ -192,12 +269,8 @@ class TestCLICommands:
         assert result.exit_code == 0
         assert "✅ Valid podcast URL" in result.output
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_validate_command_invalid_file(self, mock_pipeline_class):
+    def test_validate_command_invalid_file(self):
         """Test validate command with invalid file."""
-        self.mock_pipeline.validate_audio_file.return_value = False
-        mock_pipeline_class.return_value = self.mock_pipeline
-        
         result = self.runner.invoke(
             audio_icon_matcher_commands,
             ['validate', 'invalid.mp3']
@@ -206,11 +279,22 @@ class TestCLICommands:
         assert result.exit_code == 1
         assert "❌ Invalid audio file" in result.output
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_formats_command(self, mock_pipeline_class):
-        """Test formats command."""
-        mock_pipeline_class.return_value = self.mock_pipeline
+    def test_validate_command_unsupported_format(self):
+        """Test validate command with an existing file in an unsupported format."""
+        with self.runner.isolated_filesystem():
+            Path('notes.txt').touch()
+            
+            result = self.runner.invoke(
+                audio_icon_matcher_commands,
+                ['validate', 'notes.txt']
+            )
         
+        assert result.exit_code == 1
+        assert "❌ Invalid audio file" in result.output
+    
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_formats_command(self, mock_get_pipeline):
+        """Test formats command."""
         result = self.runner.invoke(
             audio_icon_matcher_commands,
             ['formats']
@@ -220,8 +304,10 @@ class TestCLICommands:
         assert "SUPPORTED AUDIO FORMATS" in result.output
         assert "• .mp3" in result.output
         assert "SUPPORTED PODCAST SOURCES" in result.output
+        mock_get_pipeline.assert_not_called()
     
-    def test_info_command(self):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_info_command(self, mock_get_pipeline):
         """Test info command."""
         result = self.runner.invoke(
             audio_icon_matcher_commands,
@@ -232,6 +318,7 @@ class TestCLICommands:
         assert "AUDIO-ICON MATCHER" in result.output
         assert "find-icons" in result.output
         assert "EXAMPLES:" in result.output
+        mock_get_pipeline.assert_not_called()
 
 
 class TestOutputFormatting:
@@ -371,16 +458,26 @@ class TestOutputFormatting:
     
     def test_output_results_to_stdout(self, capsys):
         """Test output results to stdout."""
-        _output_results(self.test_result, "summary")
+        _output_results(self.test_result, _format_summary_output)
         
         captured = capsys.readouterr()
         assert "AUDIO-TO-ICON PROCESSING SUCCESS" in captured.out
     
+    def test_get_formatter(self):
+        """Test formatter resolution by output format name."""
+        assert _get_formatter("json") is _format_json_output
+        assert _get_formatter("table") is _format_table_output
+        assert _get_formatter("summary") is _format_summary_output
+    
+    def test_get_formatter_unknown_format_falls_back_to_table(self):
+        """Test that an unknown output format falls back to the table format."""
+        assert _get_formatter("unknown") is _format_table_output
+    
     def test_output_results_to_file(self):
         """Test output results to file."""
         with CliRunner().isolated_filesystem():
             output_file = Path('test_output.json')
-            _output_results(self.test_result, "json", output_file)
+            _output_results(self.test_result, _format_json_output, output_file)
             
             assert output_file.exists()
             with open(output_file) as f:
@@ -416,26 +513,16 @@ class TestCLIIntegration:
         assert "--max-icons" in result.output
         assert "--confidence-threshold" in result.output
     
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_formats_command_error_handling(self, mock_pipeline_class):
-        """Test formats command error handling."""
-        mock_pipeline = Mock()
-        mock_pipeline.get_supported_formats.side_effect = Exception("Test error")
-        mock_pipeline_class.return_value = mock_pipeline
-        
-        result = self.runner.invoke(audio_icon_matcher_commands, ['formats'])
-        
-        assert result.exit_code == 1
-        assert "❌ Error getting formats" in result.output
-    
-    @patch('audio_icon_matcher.cli.main.AudioIconPipeline')
-    def test_validate_command_exception_handling(self, mock_pipeline_class):
+    @patch('audio_icon_matcher.cli.main._get_pipeline')
+    def test_validate_command_exception_handling(self, mock_get_pipeline):
         """Test validate command exception handling."""
         mock_pipeline = Mock()
-        mock_pipeline.validate_audio_file.side_effect = Exception("Validation error")
-        mock_pipeline_class.return_value = mock_pipeline
+        mock_pipeline.validate_podcast_url.side_effect = Exception("Validation error")
+        mock_get_pipeline.return_value = mock_pipeline
         
-        result = self.runner.invoke(audio_icon_matcher_commands, ['validate', 'test.mp3'])
+        result = self.runner.invoke(
+            audio_icon_matcher_commands, ['validate', 'https://podcast.example.com/feed.rss']
+        )
         
         assert result.exit_code == 1
         assert "❌ Validation error" in result.output
@@ -502,3 +589,58 @@ class TestOutputFormattingEdgeCases:
         
         assert data['subjects']['keywords'][0]['context']['domain'] == 'tech'
         assert data['subjects']['keywords'][0]['type'] == 'KEYWORD'
+    
+    def test_format_outputs_icon_without_category_or_tags(self):
+        """Test formatting of icons that have no category or tags."""
+        icon = Mock(spec=['name', 'url'])
+        icon.name = "bare-icon"
+        icon.url = "https://example.com/bare.svg"
+        result = AudioIconResult(
+            success=True,
+            transcription="Test",
+            transcription_confidence=0.9,
+            subjects={},
+            icon_matches=[IconMatch(
+                icon=icon,
+                confidence=0.7,
+                match_reason="keyword match",
+                subjects_matched=["bare"]
+            )],
+            processing_time=1.0,
+            metadata={'source_type': 'local_file'}
+        )
+        
+        table = _format_table_output(result)
+        assert "bare-icon" in table
+        assert "Category:" not in table
+        assert "Tags:" not in table
+        
+        data = json.loads(_format_json_output(result))
+        assert data['icon_matches'][0]['icon_category'] is None
+        assert data['icon_matches'][0]['icon_tags'] == []
+    
+    def test_icon_without_tags_stays_null_in_json(self):
+        """Test that an icon whose tags are None keeps icon_tags null in JSON output."""
+        icon = Mock(spec=['name', 'url', 'category', 'tags'])
+        icon.name = "untagged-icon"
+        icon.url = "https://example.com/untagged.svg"
+        icon.category = None
+        icon.tags = None
+        result = AudioIconResult(
+            success=True,
+            transcription="Test",
+            transcription_confidence=0.9,
+            subjects={},
+            icon_matches=[IconMatch(
+                icon=icon,
+                confidence=0.7,
+                match_reason="keyword match",
+                subjects_matched=["untagged"]
+            )],
+            processing_time=1.0,
+            metadata={'source_type': 'local_file'}
+        )
+        
+        assert "Tags:" not in _format_table_output(result)
+        data = json.loads(_format_json_output(result))
+        assert data['icon_matches'][0]['icon_tags'] is None
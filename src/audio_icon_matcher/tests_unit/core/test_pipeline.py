@@ -5,6 +5,7 @@ import asyncio
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from pathlib import Path
 import tempfile
+import threading
 import os
 
 from audio_icon_matcher.core.pipeline import AudioIconPipeline
@@ -17,7 +18,7 @@ from audio_icon_matcher.core.exceptions import (
 )
 from media_analyzer.models.audio.transcription import TranscriptionResult
 from media_analyzer.models.subject.identification import (
-    SubjectAnalysisResult, Subject, Category, SubjectType
+    SubjectAnalysisResult, Subject, Category, Context, SubjectType
 )
 from media_analyzer.models.podcast import PodcastEpisode, StreamingAnalysisResult
 from icon_extractor.models.icon import IconData
@@ -268,6 +269,21 @@ class TestAudioIconPipeline:
         assert pipeline.icon_matcher is not None
         assert pipeline.result_ranker is not None
     
+    def test_components_shared_across_pipelines(self):
+        """Test that processors are created on first use and shared between pipelines."""
+        with patch.dict('audio_icon_matcher.core.pipeline._MODEL_REGISTRY', clear=True), \
+             patch('audio_icon_matcher.core.pipeline.SubjectIdentifier') as mock_identifier_cls:
+            first = AudioIconPipeline()
+            second = AudioIconPipeline()
+            mock_identifier_cls.assert_not_called()
+            
+            assert first.subject_identifier is second.subject_identifier
+            mock_identifier_cls.assert_called_once()
+            
+            # Assigning a component only affects that pipeline
+            first.subject_identifier = Mock()
+            assert second.subject_identifier is mock_identifier_cls.return_value
+    
     def test_process_success(self, pipeline):
         """Test successful pipeline processing."""
         # Create temporary audio file
@@ -284,6 +300,10 @@ class TestAudioIconPipeline:
             assert len(result.icon_matches) > 0
             assert result.processing_time > 0
             assert result.metadata is not None
+            assert set(result.metadata['stage_times']) == {
+                'transcription', 'subject_identification', 'icon_matching'
+            }
+            assert sum(result.metadata['stage_times'].values()) <= result.processing_time
             
         finally:
             os.unlink(temp_path)
@@ -319,6 +339,11 @@ class TestAudioIconPipeline:
             # Should still succeed but with empty subjects
             assert result.success is True
             assert result.subjects == {}
+            assert result.icon_matches == []
+            
+            # Nothing to search for, so the icon database is not queried
+            pipeline.icon_matcher.find_matching_icons.assert_not_called()
+            pipeline.result_ranker.rank_results.assert_not_called()
             
         finally:
             os.unlink(temp_path)
@@ -332,7 +357,8 @@ class TestAudioIconPipeline:
             match_reason="low match",
             subjects_matched=["test"]
         )
-        pipeline.result_ranker.rank_results.return_value = [low_confidence_match]
+        pipeline.icon_matcher.find_matching_icons.return_value = [low_confidence_match]
+        pipeline.result_ranker = ResultRanker()
         
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
             temp_path = f.name
@@ -340,12 +366,381 @@ class TestAudioIconPipeline:
         try:
             result = pipeline.process(temp_path, confidence_threshold=0.5)
             
-            # Low confidence match should be filtered out
+            # Low confidence match should be filtered out while ranking
             assert len(result.icon_matches) == 0
+            assert result.metadata['total_matches_found'] == 1
+            assert result.metadata['matches_after_filtering'] == 0
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_process_streaming_events(self, pipeline):
+        """Test that streaming yields each stage before the final result."""
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            events = list(pipeline.process_streaming(temp_path, max_icons=5, confidence_threshold=0.5))
+            
+            assert [event for event, _ in events] == ["transcription", "subjects", "icon_match", "result"]
+            assert events[0][1] == "This is test audio about cats and dogs"
+            assert events[2][1].icon.name == "Cat Icon"
+            
+            result = events[-1][1]
+            assert isinstance(result, AudioIconResult)
+            assert result.success is True
+            assert result.subjects == events[1][1]
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_process_windowed_transcription_merges_subjects(self, pipeline, mock_audio_processor, mock_subject_identifier):
+        """Test windowed transcription joins windows and merges subjects by name."""
+        pipeline.transcription_window_seconds = 30
+        mock_audio_processor.extract_text_windows.return_value = iter([
+            TranscriptionResult(text="Cats purr.", language="en", segments=[], confidence=0.8, metadata={}),
+            TranscriptionResult(text="Cats and dogs play.", language="en", segments=[], confidence=0.6, metadata={})
+        ])
+        mock_subject_identifier.identify_subjects.side_effect = [
+            SubjectAnalysisResult(
+                subjects={Subject(name="cats", confidence=0.6, subject_type=SubjectType.KEYWORD)},
+                categories={Category(id="KEYWORD", name="keyword")}
+            ),
+            SubjectAnalysisResult(
+                subjects={
+                    Subject(name="Cats", confidence=0.9, subject_type=SubjectType.KEYWORD),
+                    Subject(name="dogs", confidence=0.7, subject_type=SubjectType.KEYWORD)
+                },
+                categories=set()
+            )
+        ]
+        
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            result = pipeline.process(temp_path)
+            
+            assert result.success is True
+            assert result.transcription == "Cats purr. Cats and dogs play."
+            assert round(result.transcription_confidence, 6) == 0.7
+            keywords = {keyword['name']: keyword['confidence'] for keyword in result.subjects['keywords']}
+            assert keywords == {"Cats": 0.9, "dogs": 0.7}
+            assert result.subjects['categories'] == [{'name': "keyword", 'id': "KEYWORD"}]
+            mock_audio_processor.extract_text.assert_not_called()
+            
+            # Icon searches are prefetched after each window into the cache used for matching
+            assert pipeline.icon_matcher.prefetch_icons.call_count == 2
+            search_cache = pipeline.icon_matcher.prefetch_icons.call_args[0][1]
+            assert pipeline.icon_matcher.find_matching_icons.call_args[1]['search_cache'] is search_cache
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_process_windowed_stops_when_subjects_stable(self, pipeline, mock_audio_processor, mock_subject_identifier):
+        """Test that windowed transcription stops once the top subjects settle."""
+        pipeline.transcription_window_seconds = 30
+        pipeline.stop_when_stable = True
+        mock_audio_processor.extract_text_windows.return_value = iter([
+            TranscriptionResult(text=f"Window {i}.", language="en", segments=[], confidence=0.8, metadata={})
+            for i in range(10)
+        ])
+        
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            result = pipeline.process(temp_path)
+            
+            # The first window sets the top subjects; two matching windows confirm them
+            assert result.success is True
+            assert result.transcription == "Window 0. Window 1. Window 2."
+            assert mock_subject_identifier.identify_subjects.call_count == 3
+            assert {keyword['name'] for keyword in result.subjects['keywords']} == {"cats", "dogs"}
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_windowed_failure_releases_transcriber(self, pipeline, mock_audio_processor):
+        """Test that an error while identifying windows does not leave the transcriber blocked."""
+        pipeline.transcription_window_seconds = 30
+        mock_audio_processor.extract_text_windows.return_value = iter([
+            TranscriptionResult(text=f"Window {i}.", language="en", segments=[], confidence=0.8, metadata={})
+            for i in range(10)
+        ])
+        
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            with patch.object(pipeline, '_convert_subjects_to_rich_dict', side_effect=RuntimeError("bad subjects")):
+                with pytest.raises(RuntimeError, match="bad subjects"):
+                    pipeline._transcribe_and_identify_windowed(temp_path)
+            
+            assert not any(
+                thread.name == "audio-icon-transcriber" for thread in threading.enumerate()
+            )
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_process_windowed_falls_back_without_window_support(self, pipeline, mock_audio_processor):
+        """Test that windowed mode uses single-pass transcription when windows are unsupported."""
+        pipeline.transcription_window_seconds = 30
+        del mock_audio_processor.extract_text_windows
+        
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            result = pipeline.process(temp_path)
+            
+            assert result.success is True
+            assert result.transcription == "This is test audio about cats and dogs"
+            mock_audio_processor.extract_text.assert_called_once()
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_process_many_preserves_order_and_isolates_failures(self, pipeline):
+        """Test batch processing of mixed sources."""
+        url_result = AudioIconResult(
+            success=True,
+            transcription="podcast",
+            transcription_confidence=0.9,
+            subjects={},
+            icon_matches=[],
+            processing_time=0.1,
+            metadata={'source_type': 'podcast'}
+        )
+        
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            with patch.object(pipeline, '_process_podcast_url', new_callable=AsyncMock) as mock_process_url:
+                mock_process_url.return_value = url_result
+                
+                results = pipeline.process_many(
+                    ["https://example.com/feed.xml", temp_path, "/nonexistent/file.wav"],
+                    confidence_threshold=0.5
+                )
+            
+            assert len(results) == 3
+            assert results[0] is url_result
+            assert results[1].success is True
+            assert results[1].metadata['audio_file'] == temp_path
+            assert results[2].success is False
+            assert "Audio file not found" in results[2].error
+            mock_process_url.assert_awaited_once()
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_process_many_local_files_staged(self, pipeline, mock_audio_processor):
+        """Test that staged processing of local files keeps order past a failed file."""
+        transcription = mock_audio_processor.extract_text.return_value
+        mock_audio_processor.extract_text.side_effect = [transcription, None, transcription]
+        
+        temp_paths = []
+        for _ in range(3):
+            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+                temp_paths.append(f.name)
+        
+        try:
+            results = pipeline.process_many(temp_paths, confidence_threshold=0.5)
+            
+            assert [result.success for result in results] == [True, False, True]
+            assert "Audio processing failed" in results[1].error
+            assert results[2].metadata['audio_file'] == temp_paths[2]
+            assert set(results[2].metadata['stage_times']) == {
+                'transcription', 'subject_identification', 'icon_matching'
+            }
+            assert pipeline.result_ranker.rank_results.call_count == 2
+            
+        finally:
+            for temp_path in temp_paths:
+                os.unlink(temp_path)
+    
+    def test_staged_processing_stops_when_a_stage_fails(self, pipeline):
+        """Test that a stage raising cancels the stages waiting on it instead of hanging."""
+        temp_paths = []
+        for _ in range(3):
+            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+                temp_paths.append(f.name)
+        
+        async def process_staged():
+            with pytest.raises(RuntimeError, match="model crashed"):
+                await pipeline._process_local_files_staged(temp_paths, 10, 0.5)
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        
+        try:
+            with patch.object(pipeline, '_identify_subjects', side_effect=RuntimeError("model crashed")):
+                leftover_tasks = asyncio.run(process_staged())
+            
+            assert leftover_tasks == []
+            
+        finally:
+            for temp_path in temp_paths:
+                os.unlink(temp_path)
+    
+    def test_process_many_local_files_inside_running_loop(self, pipeline):
+        """Test that a local-only batch works when the caller has an event loop running."""
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            temp_path = f.name
+        
+        async def process_in_loop():
+            return pipeline.process_many([temp_path])
+        
+        try:
+            results = asyncio.run(process_in_loop())
+            
+            assert len(results) == 1
+            assert results[0].success is True
             
         finally:
             os.unlink(temp_path)
     
+    def test_process_many_urls_inside_running_loop_raises(self, pipeline):
+        """Test that a batch with podcast URLs names process_many in its async-context error."""
+        async def process_in_loop():
+            return pipeline.process_many(["https://example.com/feed.xml"])
+        
+        with pytest.raises(AudioIconProcessingError, match=r"process_many\(\).*process_async"):
+            asyncio.run(process_in_loop())
+    
+    def test_process_many_transcribes_smallest_file_first(self, pipeline, mock_audio_processor):
+        """Test that local files are transcribed in ascending size but returned in input order."""
+        temp_paths = []
+        for size in (300, 100, 200):
+            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+                f.write(b"\0" * size)
+                temp_paths.append(f.name)
+        
+        try:
+            results = pipeline.process_many(temp_paths)
+            
+            transcribed = [str(call[0][0]) for call in mock_audio_processor.extract_text.call_args_list]
+            assert transcribed == [temp_paths[1], temp_paths[2], temp_paths[0]]
+            assert [result.metadata['audio_file'] for result in results] == temp_paths
+            
+        finally:
+            for temp_path in temp_paths:
+                os.unlink(temp_path)
+    
+    def test_podcast_urls_share_background_loop(self, pipeline):
+        """Test that podcast URLs from sync and async callers run on one reused loop."""
+        loops = []
+        
+        async def fake_process_podcast_url(*args, **kwargs):
+            loops.append(asyncio.get_running_loop())
+            return Mock(spec=AudioIconResult)
+        
+        with patch.object(pipeline, '_process_podcast_url', side_effect=fake_process_podcast_url), \
+             patch.object(pipeline, 'cleanup', new_callable=AsyncMock) as mock_cleanup:
+            pipeline.process("https://example.com/feed.xml")
+            pipeline.process("https://example.com/other.xml")
+            asyncio.run(pipeline.process_async("https://example.com/feed.xml"))
+        
+        assert len(loops) == 3
+        assert loops[0] is loops[1] is loops[2]
+        assert loops[0].is_running()
+        # HTTP sessions are kept open between calls for connection reuse
+        mock_cleanup.assert_not_called()
+    
+    def test_content_hash_cache_reuses_transcription_and_subjects(self, pipeline, mock_audio_processor, mock_subject_identifier):
+        """Test that identical audio content skips transcription and subject identification."""
+        pipeline.cache_size = 4
+        temp_paths = []
+        for _ in range(2):
+            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+                f.write(b"same audio")
+                temp_paths.append(f.name)
+        
+        try:
+            first = pipeline.process(temp_paths[0])
+            first.subjects.clear()
+            second = pipeline.process(temp_paths[1])
+            
+            assert mock_audio_processor.extract_text.call_count == 1
+            assert mock_subject_identifier.identify_subjects.call_count == 1
+            assert second.success is True
+            assert second.subjects
+            assert second.metadata['audio_file'] == temp_paths[1]
+            
+            pipeline.clear_cache()
+            pipeline.process(temp_paths[0])
+            assert mock_audio_processor.extract_text.call_count == 2
+            
+        finally:
+            for temp_path in temp_paths:
+                os.unlink(temp_path)
+    
+    def test_background_loop_shutdown_and_restart(self):
+        """Test that the background loop stops cleanly and restarts on next use."""
+        from audio_icon_matcher.core import pipeline as pipeline_module
+        
+        loop = pipeline_module._get_background_loop()
+        pipeline_module._shutdown_background_loop()
+        
+        assert loop.is_closed()
+        new_loop = pipeline_module._get_background_loop()
+        assert new_loop is not loop
+        assert asyncio.run_coroutine_threadsafe(asyncio.sleep(0, result="ok"), new_loop).result(timeout=5) == "ok"
+    
+    def test_podcast_urls_limited_to_max_concurrent_urls(self, pipeline):
+        """Test that episode analyses never exceed max_concurrent_urls in flight."""
+        pipeline.max_concurrent_urls = 2
+        in_flight = 0
+        peak = 0
+        
+        async def fake_analyze_episode(url, options):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(success=False, error_message="no episode")
+        
+        pipeline.podcast_analyzer = Mock()
+        pipeline.podcast_analyzer.analyze_episode = fake_analyze_episode
+        
+        urls = [f"https://example.com/feed{i}.xml" for i in range(5)]
+        results = pipeline.process_many(urls, batch_size=5)
+        
+        assert peak == 2
+        assert all(result.success is False for result in results)
+    
+    def test_podcast_icon_matching_runs_off_the_event_loop(self, pipeline):
+        """Test that a podcast's icon searches do not block the shared event loop."""
+        match_threads = []
+        
+        def fake_match_subjects_to_icons(subjects, max_icons, search_cache=None, confidence_threshold=0.0):
+            match_threads.append(threading.current_thread())
+            return [], 0
+        
+        pipeline.podcast_analyzer = Mock()
+        pipeline.podcast_analyzer.analyze_episode = AsyncMock(return_value=Mock(
+            success=True, transcription=None, subjects=[], episode=None
+        ))
+        
+        with patch.object(pipeline, '_match_subjects_to_icons', side_effect=fake_match_subjects_to_icons):
+            result = pipeline.process("https://example.com/feed.xml")
+        
+        assert result.success
+        assert len(match_threads) == 1
+        assert match_threads[0].name != "audio-icon-pipeline-loop"
+    
+    def test_invalid_max_concurrent_urls(self):
+        """Test that max_concurrent_urls must be positive."""
+        with pytest.raises(ValueError, match="max_concurrent_urls"):
+            AudioIconPipeline(max_concurrent_urls=0)
+    
+    def test_process_many_invalid_batch_size(self, pipeline):
+        """Test that batch_size must be positive."""
+        with pytest.raises(ValueError, match="batch_size"):
+            pipeline.process_many([], batch_size=0)
+    
     def test_validate_audio_file_success(self, pipeline):
         """Test successful audio file validation."""
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
@@ -368,6 +763,19 @@ class TestAudioIconPipeline:
         pipeline.audio_processor.validate_file.side_effect = Exception("Invalid file")
         assert pipeline.validate_audio_file("/invalid/file.wav") is False
     
+    def test_validate_audio_file_unsupported_extension(self, pipeline):
+        """Test that unsupported extensions are rejected before the processor runs."""
+        assert pipeline.validate_audio_file("notes.txt") is False
+        pipeline.audio_processor.validate_file.assert_not_called()
+    
+    def test_build_metadata(self, pipeline):
+        """Test that result metadata is tagged with source type and pipeline version."""
+        metadata = pipeline._build_metadata('podcast', source_url="https://example.com/feed.xml", error_type="ValueError")
+        
+        assert list(metadata) == ['source_type', 'source_url', 'error_type', 'pipeline_version']
+        assert metadata['source_type'] == 'podcast'
+        assert metadata['pipeline_version'] == '1.1'
+    
     def test_get_supported_formats(self, pipeline):
         """Test getting supported formats."""
         formats = pipeline.get_supported_formats()
@@ -644,6 +1052,27 @@ class TestPodcastIntegration:
             assert "Podcast analysis failed" in result.error
             assert result.metadata['source_type'] == 'podcast'
     
+    @pytest.mark.asyncio
+    async def test_process_podcast_url_episode_selection_options(self):
+        """Test that episode selection overrides the shared analysis options."""
+        pipeline = AudioIconPipeline()
+        failed_result = Mock(success=False, error_message="stop")
+        
+        with patch.object(pipeline.podcast_analyzer, 'analyze_episode', new_callable=AsyncMock) as mock_analyze:
+            mock_analyze.return_value = failed_result
+            
+            await pipeline._process_podcast_url("https://example.com/feed.xml", 10, 0.3)
+            await pipeline._process_podcast_url(
+                "https://example.com/feed.xml", 10, 0.3, episode_index=2, episode_title="Cats"
+            )
+        
+        default_options = mock_analyze.call_args_list[0][0][1]
+        selected_options = mock_analyze.call_args_list[1][0][1]
+        assert (default_options.episode_index, default_options.episode_title) == (0, None)
+        assert (selected_options.episode_index, selected_options.episode_title) == (2, "Cats")
+        assert selected_options.max_duration_minutes == default_options.max_duration_minutes == 4
+        assert selected_options.confidence_threshold == 0.3
+    
     def test_convert_subjects_to_rich_dict(self):
         """Test the unified subjects conversion method."""
         pipeline = AudioIconPipeline()
@@ -671,14 +1100,170 @@ class TestPodcastIntegration:
         assert len(result['entities']) == 1
         assert result['entities'][0]['name'] == "Fluffy"
     
+    def test_convert_subjects_to_rich_dict_unknown_type_and_context(self):
+        """Test that unknown subject types fall back to keywords and context is kept."""
+        pipeline = AudioIconPipeline()
+        
+        subject = Mock(spec=['name', 'confidence', 'subject_type', 'context'])
+        subject.name = "storm"
+        subject.confidence = 0.9
+        subject.subject_type = "phrase"
+        subject.context = Mock(domain="weather", language="en")
+        
+        result = pipeline._convert_subjects_to_rich_dict([subject])
+        
+        assert result['keywords'] == [{
+            'name': "storm",
+            'confidence': 0.9,
+            'type': "PHRASE",
+            'context': {'domain': "weather", 'language': "en"}
+        }]
+        assert result['topics'] == [] and result['entities'] == []
+
+    def test_convert_subjects_to_rich_dict_string_type_variants(self):
+        """Test that plain string types are routed by the type they name."""
+        pipeline = AudioIconPipeline()
+
+        subjects = []
+        for name, subject_type in [("space", "topics"), ("Felix", "named_entity"), ("cat", "keywords")]:
+            subject = Mock(spec=['name', 'confidence', 'subject_type', 'context'])
+            subject.name = name
+            subject.confidence = 0.8
+            subject.subject_type = subject_type
+            subject.context = None
+            subjects.append(subject)
+
+        result = pipeline._convert_subjects_to_rich_dict(subjects)
+
+        assert [(s['name'], s['type']) for s in result['topics']] == [("space", "TOPICS")]
+        assert [(s['name'], s['type']) for s in result['entities']] == [("Felix", "NAMED_ENTITY")]
+        assert [(s['name'], s['type']) for s in result['keywords']] == [("cat", "KEYWORDS")]
+
+    def test_convert_subjects_to_rich_dict_subject_context(self):
+        """Test that Subject instances keep their type label and context."""
+        pipeline = AudioIconPipeline()
+        
+        subject = Subject(
+            name="London",
+            subject_type=SubjectType.ENTITY,
+            confidence=0.8,
+            context=Context(domain="travel", language="en", confidence=0.9)
+        )
+        
+        result = pipeline._convert_subjects_to_rich_dict([subject])
+        
+        assert result['entities'] == [{
+            'name': "London",
+            'confidence': 0.8,
+            'type': "ENTITY",
+            'context': {'domain': "travel", 'language': "en"}
+        }]
+    
     @pytest.mark.asyncio
     async def test_cleanup(self):
-        """Test pipeline cleanup."""
+        """Test that cleanup closes a podcast analyzer assigned to the pipeline."""
         pipeline = AudioIconPipeline()
+        pipeline.podcast_analyzer = Mock()
+        pipeline.podcast_analyzer.cleanup = AsyncMock()
+        
+        await pipeline.cleanup()
+        
+        pipeline.podcast_analyzer.cleanup.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_leaves_shared_podcast_sessions_open(self):
+        """Test that cleanup does not close sessions other pipelines may be using."""
+        pipeline = AudioIconPipeline()
+        other_pipeline = AudioIconPipeline()
+        assert pipeline.podcast_analyzer is other_pipeline.podcast_analyzer
         
         with patch.object(pipeline.podcast_analyzer, 'cleanup', new_callable=AsyncMock) as mock_cleanup:
             await pipeline.cleanup()
-            mock_cleanup.assert_called_once()
+            
+            mock_cleanup.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_only_own_podcast_analyzer_is_tracked_for_cleanup(self):
+        """Test that podcast calls mark sessions open only for an analyzer the pipeline owns."""
+        failed_result = Mock(success=False, error_message="stop")
+        shared_pipeline = AudioIconPipeline()
+        own_pipeline = AudioIconPipeline()
+        own_pipeline.podcast_analyzer = Mock()
+        own_pipeline.podcast_analyzer.analyze_episode = AsyncMock(return_value=failed_result)
+        own_pipeline.podcast_analyzer.cleanup = AsyncMock()
+        
+        with patch.object(shared_pipeline.podcast_analyzer, 'analyze_episode', new_callable=AsyncMock) as mock_analyze:
+            mock_analyze.return_value = failed_result
+            await shared_pipeline._process_podcast_url("https://example.com/feed.xml", 10, 0.3)
+        await own_pipeline._process_podcast_url("https://example.com/feed.xml", 10, 0.3)
+        
+        assert shared_pipeline._cleanup_state['sessions_open'] is False
+        assert own_pipeline._cleanup_state['sessions_open'] is True
+        await own_pipeline.cleanup()
+        assert own_pipeline._cleanup_state['sessions_open'] is False
+    
+    @pytest.mark.asyncio
+    async def test_async_context_manager_cleans_up(self):
+        """Test that leaving an async with block cleans up the pipeline."""
+        pipeline = AudioIconPipeline()
+        pipeline.podcast_analyzer = Mock()
+        mock_cleanup = pipeline.podcast_analyzer.cleanup = AsyncMock()
+        
+        async with pipeline as entered:
+            assert entered is pipeline
+            mock_cleanup.assert_not_called()
+        mock_cleanup.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_async_context_manager_leaves_shared_sessions_open(self):
+        """Test that leaving an async with block keeps sessions other pipelines share."""
+        pipeline = AudioIconPipeline()
+        
+        with patch.object(pipeline.podcast_analyzer, 'cleanup', new_callable=AsyncMock) as mock_cleanup:
+            async with pipeline:
+                pass
+            mock_cleanup.assert_not_called()
+    
+    def test_context_manager_cleans_up(self):
+        """Test that leaving a with block cleans up the pipeline."""
+        pipeline = AudioIconPipeline()
+        pipeline.podcast_analyzer = Mock()
+        mock_cleanup = pipeline.podcast_analyzer.cleanup = AsyncMock()
+        
+        with pipeline as entered:
+            assert entered is pipeline
+            pipeline._cleanup_state['sessions_open'] = True
+            mock_cleanup.assert_not_called()
+        mock_cleanup.assert_awaited_once()
+        assert pipeline._cleanup_state['sessions_open'] is False
+    
+    def test_close_without_own_analyzer_skips_background_loop(self):
+        """Test that close() has nothing to do for a pipeline using only shared processors."""
+        from audio_icon_matcher.core import pipeline as pipeline_module
+        
+        pipeline = AudioIconPipeline()
+        
+        with patch.object(pipeline_module, '_get_background_loop') as mock_get_loop:
+            pipeline.close()
+        
+        mock_get_loop.assert_not_called()
+    
+    def test_close_on_background_loop_raises(self):
+        """Test that close() refuses to block the background loop on itself."""
+        from audio_icon_matcher.core import pipeline as pipeline_module
+        
+        pipeline = AudioIconPipeline()
+        pipeline.podcast_analyzer = Mock()
+        pipeline.podcast_analyzer.cleanup = AsyncMock()
+        
+        async def close_on_loop():
+            pipeline.close()
+        
+        with pytest.raises(AudioIconProcessingError, match="await pipeline.cleanup"):
+            asyncio.run_coroutine_threadsafe(
+                close_on_loop(), pipeline_module._get_background_loop()
+            ).result(timeout=5)
+        pipeline.podcast_analyzer.cleanup.assert_not_called()
 
 
 # Integration tests that require the full pipeline
@@ -33,6 +33,19 @@ class TestIconMatch:
         assert match.match_reason == "Keyword match: test"
         assert match.subjects_matched == ["test", "keyword"]
     
+    def test_icon_match_has_no_instance_dict(self):
+        """Test that IconMatch instances only hold their declared fields."""
+        match = IconMatch(
+            icon=self.icon_data,
+            confidence=0.85,
+            match_reason="Keyword match: test",
+            subjects_matched=["test"]
+        )
+        
+        assert not hasattr(match, '__dict__')
+        with pytest.raises(AttributeError):
+            match.extra = True
+    
     def test_icon_match_with_empty_subjects(self):
         """Test creating IconMatch with empty subjects list."""
         match = IconMatch(
@@ -1,6 +1,7 @@
 """Additional tests for icon_matcher.py to improve coverage."""
 
 import pytest
+import threading
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
@@ -389,7 +390,243 @@ class TestIconMatcherLowConfidenceFiltering:
             assert matches[0].confidence >= 0.6
             # Should combine subjects matched
             assert len(matches[0].subjects_matched) >= 1
+    
+    def test_find_matching_icons_searches_repeated_terms_once(self):
+        """Test that a term found in several subject groups is searched once."""
+        mock_icons = [
+            IconData(name="dog", url="https://example.com/dog.svg", tags=["dog"])
+        ]
+        
+        with patch.object(self.matcher.icon_service, 'search_icons', return_value=mock_icons) as mock_search:
+            subjects = {
+                'keywords': [{'name': 'dog', 'confidence': 0.8, 'type': 'KEYWORD'}],
+                'entities': [{'name': 'dog', 'confidence': 0.6, 'type': 'ENTITY'}]
+            }
+            
+            matches = self.matcher.find_matching_icons(subjects)
+            
+            assert mock_search.call_count == 1
+            assert matches[0].subjects_matched[0] == 'dog'
+    
+    def test_find_matching_icons_scores_icon_once_per_term(self):
+        """Test that an icon returned by a term's plain and category searches is scored once."""
+        mock_icons = [
+            IconData(name="dog", url="https://example.com/dog.svg", tags=["dog"])
+        ]
+        subjects = {
+            'keywords': [{'name': 'dog', 'confidence': 0.8, 'type': 'KEYWORD'}],
+            'categories': ['animals', 'pets']
+        }
+        
+        with patch.object(self.matcher.icon_service, 'search_icons', return_value=mock_icons), \
+             patch.object(self.matcher, '_calculate_confidence', wraps=self.matcher._calculate_confidence) as mock_score:
+            matches = self.matcher.find_matching_icons(subjects)
+        
+        assert mock_score.call_count == 1
+        assert len(matches) == 1
+        assert matches[0].subjects_matched == ['dog']
+    
+    def test_find_matching_icons_leaves_icons_unchanged(self):
+        """Test that scoring keeps nothing on the icons, so later field changes are seen."""
+        icon = IconData(
+            name="dog", url="https://example.com/dog.svg", tags=["dog"],
+            metadata={'num_downloads': '2,000'}
+        )
+        fields_before = dict(vars(icon))
+        subjects = {'keywords': [{'name': 'dog', 'confidence': 0.55, 'type': 'KEYWORD'}]}
+        
+        with patch.object(self.matcher.icon_service, 'search_icons', return_value=[icon]):
+            first = self.matcher.find_matching_icons(subjects)[0].confidence
+            assert vars(icon) == fields_before
+            
+            icon.name = "leash"
+            second = self.matcher.find_matching_icons(subjects)[0].confidence
+        
+        assert second < first
+    
+    def test_find_matching_icons_drops_pairs_below_min_confidence(self):
+        """Test that scored pairs below min_confidence never become matches."""
+        matcher = IconMatcher(min_confidence=0.6)
+        mock_icons = [
+            IconData(name="cat", url="https://example.com/cat.svg", tags=["cat"]),
+            IconData(name="bowl", url="https://example.com/bowl.svg", tags=["kitchen"])
+        ]
+        
+        with patch.object(matcher.icon_service, 'search_icons', return_value=mock_icons):
+            subjects = {'keywords': [{'name': 'cat', 'confidence': 0.6, 'type': 'KEYWORD'}]}
+            
+            matches = matcher.find_matching_icons(subjects)
+            
+            assert [match.icon.name for match in matches] == ["cat"]
+            assert IconMatcher().min_confidence == IconMatcher.MIN_KEEP_CONFIDENCE
+    
+    def test_prefetch_icons_fills_search_cache(self):
+        """Test that prefetched searches are reused by find_matching_icons."""
+        mock_icons = [
+            IconData(name="cat-icon", url="https://example.com/cat.svg", tags=["cat"])
+        ]
+        subjects = {
+            'keywords': [{'name': 'cat', 'confidence': 0.8, 'type': 'KEYWORD'}],
+            'categories': ['animals']
+        }
+        search_cache = {}
+        
+        with patch.object(self.matcher.icon_service, 'search_icons', return_value=mock_icons) as mock_search:
+            self.matcher.prefetch_icons(subjects, search_cache)
+            assert mock_search.call_count == 2
+            assert set(search_cache) == {('cat', None, 5), ('cat', 'animals', 3)}
+            
+            self.matcher.prefetch_icons(subjects, search_cache)
+            matches = self.matcher.find_matching_icons(subjects, search_cache=search_cache)
+            
+            assert mock_search.call_count == 2
+            assert [match.icon.name for match in matches] == ["cat-icon"]
+    
+    def test_search_cache_reuses_results_across_calls(self):
+        """Test that kept search results skip the icon service on later calls."""
+        matcher = IconMatcher(search_cache_size=1)
+        mock_icons = [
+            IconData(name="cat-icon", url="https://example.com/cat.svg", tags=["cat"])
+        ]
+        
+        with patch.object(matcher.icon_service, 'search_icons', return_value=mock_icons) as mock_search:
+            matcher.find_matching_icons({'keywords': [{'name': 'Cat', 'confidence': 0.8, 'type': 'KEYWORD'}]})
+            matches = matcher.find_matching_icons({'keywords': [{'name': 'cat', 'confidence': 0.8, 'type': 'KEYWORD'}]})
+            assert mock_search.call_count == 1
+            assert [match.icon.name for match in matches] == ["cat-icon"]
+            
+            # The least recently used search is evicted beyond search_cache_size
+            matcher.find_matching_icons({'keywords': [{'name': 'dog', 'confidence': 0.8, 'type': 'KEYWORD'}]})
+            matcher.find_matching_icons({'keywords': [{'name': 'cat', 'confidence': 0.8, 'type': 'KEYWORD'}]})
+            assert mock_search.call_count == 3
+            
+            matcher.clear_search_cache()
+            matcher.find_matching_icons({'keywords': [{'name': 'cat', 'confidence': 0.8, 'type': 'KEYWORD'}]})
+            assert mock_search.call_count == 4
+    
+    def test_search_cache_expires_after_ttl(self):
+        """Test that kept search results are searched again once older than search_cache_ttl."""
+        matcher = IconMatcher(search_cache_size=8, search_cache_ttl=60.0)
+        mock_icons = [
+            IconData(name="cat-icon", url="https://example.com/cat.svg", tags=["cat"])
+        ]
+        subjects = {'keywords': [{'name': 'cat', 'confidence': 0.8, 'type': 'KEYWORD'}]}
+        
+        with patch.object(matcher.icon_service, 'search_icons', return_value=mock_icons) as mock_search, \
+             patch('audio_icon_matcher.processors.icon_matcher.time.monotonic', side_effect=[0.0, 30.0, 100.0, 100.0]):
+            matcher.find_matching_icons(subjects)
+            matcher.find_matching_icons(subjects)
+            assert mock_search.call_count == 1
+            
+            matcher.find_matching_icons(subjects)
+            assert mock_search.call_count == 2
+    
+    def test_other_threads_use_injected_icon_service(self):
+        """Test that a matcher shared across threads searches its injected service."""
+        mock_icons = [
+            IconData(name="cat-icon", url="https://example.com/cat.svg", tags=["cat"])
+        ]
+        subjects = {'keywords': [{'name': 'cat', 'confidence': 0.8, 'type': 'KEYWORD'}]}
+        matcher = IconMatcher()
+        matcher.icon_service = Mock()
+        matcher.icon_service.search_icons.return_value = mock_icons
+        
+        results = []
+        thread = threading.Thread(target=lambda: results.append(matcher.find_matching_icons(subjects)))
+        thread.start()
+        thread.join()
+        
+        matcher.icon_service.search_icons.assert_called_once()
+        assert [match.icon.name for match in results[0]] == ["cat-icon"]
+    
+    def test_worker_searches_close_their_session(self):
+        """Test that worker threads hand their database session back after each search."""
+        subjects = {
+            'keywords': [{'name': 'cat', 'confidence': 0.8, 'type': 'KEYWORD'}],
+            'topics': [{'name': 'pets', 'confidence': 0.7, 'type': 'TOPIC'}]
+        }
+        services = []
+        
+        def make_service():
+            service = Mock()
+            service.search_icons.return_value = []
+            services.append(service)
+            return service
+        
+        with patch('audio_icon_matcher.processors.icon_matcher.IconService', side_effect=make_service):
+            matcher = IconMatcher(search_workers=2)
+            matcher.find_matching_icons(subjects)
+        
+        worker_services = services[1:]
+        assert worker_services
+        assert sum(service.search_icons.call_count for service in worker_services) == 2
+        for service in worker_services:
+            assert service.repository.close.call_count == service.search_icons.call_count
+    
+    def test_concurrent_searches_match_sequential_results(self):
+        """Test that searching on worker threads gives the sequential results."""
+        icons_by_query = {
+            'cat': [IconData(name="cat", url="https://example.com/cat.svg", tags=["cat", "pet"])],
+            'pets': [IconData(name="pet-bowl", url="https://example.com/bowl.svg", tags=["pet"])],
+            'Felix': [IconData(name="cat", url="https://example.com/cat.svg", tags=["cat", "pet"])],
+        }
+        subjects = {
+            'keywords': [{'name': 'cat', 'confidence': 0.8, 'type': 'KEYWORD'}],
+            'topics': [{'name': 'pets', 'confidence': 0.7, 'type': 'TOPIC'}],
+            'entities': [{'name': 'Felix', 'confidence': 0.6, 'type': 'ENTITY'}],
+            'categories': ['animals']
+        }
+        
+        with patch('audio_icon_matcher.processors.icon_matcher.IconService') as mock_service_class:
+            mock_search = mock_service_class.return_value.search_icons
+            mock_search.side_effect = lambda query, limit, category=None: icons_by_query[query][:limit]
+            
+            sequential = IconMatcher().find_matching_icons(subjects)
+            sequential_calls = mock_search.call_count
+            mock_search.reset_mock()
+            concurrent = IconMatcher(search_workers=3).find_matching_icons(subjects)
+        
+        assert mock_search.call_count == sequential_calls == 6
+        assert [(m.icon.url, m.confidence, m.subjects_matched) for m in concurrent] == \
+            [(m.icon.url, m.confidence, m.subjects_matched) for m in sequential]
 
+    
+    def test_bulk_search_matches_single_searches(self):
+        """Test that one bulk search gives the single-search results."""
+        icons_by_query = {
+            'cat': [IconData(name="cat", url="https://example.com/cat.svg", tags=["cat", "pet"])],
+            'pets': [IconData(name="pet-bowl", url="https://example.com/bowl.svg", tags=["pet"])],
+        }
+        subjects = {
+            'keywords': [{'name': 'cat', 'confidence': 0.8, 'type': 'KEYWORD'}],
+            'topics': [{'name': 'pets', 'confidence': 0.7, 'type': 'TOPIC'}],
+            'categories': ['animals', 'home']
+        }
+        
+        def search_icons_bulk(searches):
+            return {(query, category, limit): icons_by_query[query][:limit] for query, category, limit in searches}
+        
+        with patch('audio_icon_matcher.processors.icon_matcher.IconService') as mock_service_class:
+            mock_service = mock_service_class.return_value
+            mock_service.search_icons.side_effect = lambda query, limit, category=None: icons_by_query[query][:limit]
+            mock_service.search_icons_bulk.side_effect = search_icons_bulk
+            
+            single = IconMatcher().find_matching_icons(subjects)
+            mock_service.search_icons.reset_mock()
+            bulk = IconMatcher(bulk_search=True).find_matching_icons(subjects)
+            
+            mock_service.search_icons_bulk.assert_called_once()
+            assert len(mock_service.search_icons_bulk.call_args[0][0]) == 6
+            mock_service.search_icons.assert_not_called()
+            assert [(m.icon.url, m.confidence, m.subjects_matched) for m in bulk] == \
+                [(m.icon.url, m.confidence, m.subjects_matched) for m in single]
+            
+            # A failed bulk search falls back to one search per term
+            mock_service.search_icons_bulk.side_effect = Exception("Database Error")
+            fallback = IconMatcher(bulk_search=True).find_matching_icons(subjects)
+            
+            assert mock_service.search_icons.call_count == 6
+            assert [m.icon.url for m in fallback] == [m.icon.url for m in single]
 
 class TestIconMatcherContextualBoosts:
     """Test contextual confidence boosts."""
@@ -140,3 +140,27 @@ class TestResultRanker:
         assert len(ranked) == 2
         assert abs(ranked[0].confidence - 0.98) < 0.01  # adjusted match1
         assert abs(ranked[1].confidence - 0.68) < 0.01  # adjusted match2
+    
+    def test_rank_results_category_boost(self):
+        """Test that category names boost matching icons case-insensitively."""
+        animal_icon = IconData(
+            name="cat",
+            url="https://example.com/cat.svg",
+            tags=["cat", "pet", "animal"],
+            category="Wild Animals"
+        )
+        match = IconMatch(icon=animal_icon, confidence=0.5, match_reason="match", subjects_matched=["cat"])
+        subjects = {'categories': ['ANIMALS', Mock(__str__=Mock(return_value='nature'))]}
+        
+        ranked = self.ranker.rank_results([match], subjects)
+        
+        assert abs(ranked[0].confidence - 0.58) < 0.01
+    
+    def test_rank_results_min_confidence(self):
+        """Test that matches below the minimum adjusted confidence are dropped."""
+        matches = [self.match3, self.match1, self.match2]
+        subjects = {'keywords': []}
+        
+        ranked = self.ranker.rank_results(matches, subjects, limit=5, min_confidence=0.5)
+        
+        assert ranked == [self.match1, self.match2]
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from ..database.repository import IconRepository
 from ..database.connection import db_manager
@@ -148,6 +148,30 @@ class IconService:
             logger.error(f"Icon search failed: {e}")
             raise IconCuratorError(f"Failed to search icons: {e}") from e
     
+    def search_icons_bulk(
+        self,
+        searches: List[Tuple[str, Optional[str], int]]
+    ) -> Dict[Tuple[str, Optional[str], int], List[IconData]]:
+        """Run several icon searches in one database call.
+        
+        Args:
+            searches: (query, category, limit) searches, each as for search_icons
+            
+        Returns:
+            Dictionary mapping each search to its matching IconData objects
+        """
+        try:
+            models_by_search = self.repository.search_icons_bulk(searches)
+            
+            return {
+                search: [self._model_to_data(model) for model in models]
+                for search, models in models_by_search.items()
+            }
+            
+        except Exception as e:
+            logger.error(f"Bulk icon search failed: {e}")
+            raise IconCuratorError(f"Failed to search icons: {e}") from e
+    
     def get_icon_by_id(self, icon_id: int) -> Optional[IconData]:
         """Get icon by ID.
         
@@ -1,9 +1,9 @@
 """Repository for icon data access."""
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-from sqlalchemy import or_, func, text
+from sqlalchemy import func, literal, or_, select, text, union_all
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -177,6 +177,65 @@ class IconRepository:
         except SQLAlchemyError as e:
             raise DatabaseError(f"Failed to search icons: {e}") from e
     
+    def search_icons_bulk(
+        self, 
+        searches: List[Tuple[str, Optional[str], int]]
+    ) -> Dict[Tuple[str, Optional[str], int], List[IconModel]]:
+        """Run several searches in a single database round-trip.
+        
+        Each search is matched, filtered by its category and limited on its
+        own, as in search_icons, and the limited selections are combined with
+        UNION ALL so the database returns every search's results from one
+        statement.
+        
+        Args:
+            searches: (query, category, limit) searches; query and category
+                are matched as in search_icons, and limit applies per search
+            
+        Returns:
+            Dictionary mapping each search to its matching icon models,
+            ordered by id; duplicate searches share one entry
+        """
+        unique_searches = list(dict.fromkeys(searches))
+        if not unique_searches:
+            return {}
+        
+        try:
+            selections = []
+            for index, (query, category, limit) in enumerate(unique_searches):
+                selection = select(
+                    IconModel.id.label('icon_id'),
+                    literal(index).label('search_index')
+                )
+                if query:
+                    selection = selection.where(or_(
+                        IconModel.name.ilike(f"%{query}%"),
+                        IconModel.description.ilike(f"%{query}%")
+                    ))
+                if category:
+                    selection = selection.where(IconModel.category == category)
+                selections.append(select(selection.limit(limit).subquery()))
+            
+            matches = union_all(*selections).subquery()
+            # Row order is otherwise up to the query plan; callers rely on
+            # a stable order to break ties between equally scored icons
+            rows = (
+                self.session.query(IconModel, matches.c.search_index)
+                .join(matches, IconModel.id == matches.c.icon_id)
+                .order_by(matches.c.search_index, IconModel.id)
+                .all()
+            )
+            
+            results: Dict[Tuple[str, Optional[str], int], List[IconModel]] = {
+                search: [] for search in unique_searches
+            }
+            for model, search_index in rows:
+                results[unique_searches[search_index]].append(model)
+            return results
+            
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to search icons: {e}") from e
+    
     def search_icons_by_artist(self, artist: str, limit: int = 50) -> List[IconModel]:
         """Search icons by artist name.
         
@@ -137,6 +137,43 @@ class TestDatabaseIntegration:
         assert len(cat_icons) == 1
         assert cat_icons[0].name == "Cat Icon"
 
+    @pytest.mark.integration
+    def test_search_icons_bulk_matches_search_icons(self, icon_repository, test_db_session):
+        """Test that a bulk search returns what each single search returns."""
+        icons = [
+            IconData(name="Cat Icon", url="https://example.com/cat.svg", tags=[], category="Animals"),
+            IconData(name="Wild Cat Icon", url="https://example.com/wild-cat.svg", tags=[], category="Animals"),
+            IconData(name="Cat Tree Icon", url="https://example.com/cat-tree.svg", tags=[], category="Nature"),
+            IconData(name="Dog Icon", url="https://example.com/dog.svg", tags=[], category="Animals"),
+            IconData(name="Tree Icon", url="https://example.com/tree.svg", tags=[], category="Nature")
+        ]
+        for icon in icons:
+            icon_repository.save_icon(icon)
+        test_db_session.commit()
+
+        searches = [
+            ("Cat", None, 10),
+            ("Cat", "Animals", 10),
+            ("Tree", None, 10),
+            ("Dog", "Nature", 10),
+            ("Cat", None, 10)
+        ]
+        bulk_results = icon_repository.search_icons_bulk(searches)
+
+        assert len(bulk_results) == 4
+        for query, category, limit in searches:
+            single = icon_repository.search_icons(query=query, category=category, limit=limit)
+            bulk = bulk_results[(query, category, limit)]
+            assert sorted(icon.url for icon in bulk) == sorted(icon.url for icon in single)
+        assert bulk_results[("Dog", "Nature", 10)] == []
+
+        # Each search is limited on its own, and rows come back in id order
+        limited = icon_repository.search_icons_bulk([("Cat", None, 2), ("Tree", None, 1)])
+        assert len(limited[("Cat", None, 2)]) == 2
+        assert len(limited[("Tree", None, 1)]) == 1
+        cat_ids = [icon.id for icon in limited[("Cat", None, 2)]]
+        assert cat_ids == sorted(cat_ids)
+
     def test_database_url_consistency(self, test_db_session):
         """Test that database correctly stores single URL field (no image_url)."""
         # Create icon directly with database model
@@ -0,0 +1,83 @@
+"""Unit tests for the icon service."""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.icon_extractor.core.exceptions import DatabaseError, IconCuratorError
+from src.icon_extractor.core.service import IconService
+from src.icon_extractor.database.repository import IconRepository
+
+
+def _icon_model(name, category="Animals"):
+    """Build a stand-in icon model with the columns the service reads."""
+    model = Mock()
+    model.name = name
+    model.url = f"https://example.com/{name.lower()}.png"
+    model.tags = ["animal"]
+    model.description = f"{name} icon"
+    model.category = category
+    model.created_at = None
+    model.updated_at = None
+    model.icon_metadata = None
+    model.yoto_icon_id = None
+    model.primary_tag = None
+    model.secondary_tag = None
+    model.artist = None
+    model.num_downloads = None
+    return model
+
+
+class TestIconServiceSearchIconsBulk:
+    """Test cases for IconService.search_icons_bulk."""
+
+    def test_search_icons_bulk_converts_models(self):
+        """Test that each search maps to IconData built from its models."""
+        repository = Mock()
+        repository.search_icons_bulk.return_value = {
+            ("cat", None, 5): [_icon_model("Cat")],
+            ("dog", "Animals", 3): [],
+        }
+        service = IconService(repository=repository, scraper=Mock())
+
+        results = service.search_icons_bulk(
+            [("cat", None, 5), ("dog", "Animals", 3), ("cat", None, 5)]
+        )
+
+        repository.search_icons_bulk.assert_called_once_with(
+            [("cat", None, 5), ("dog", "Animals", 3), ("cat", None, 5)]
+        )
+        assert set(results) == {("cat", None, 5), ("dog", "Animals", 3)}
+        assert [icon.name for icon in results[("cat", None, 5)]] == ["Cat"]
+        assert results[("cat", None, 5)][0].url == "https://example.com/cat.png"
+        assert results[("dog", "Animals", 3)] == []
+
+    def test_search_icons_bulk_empty(self):
+        """Test that an empty search list gives an empty result."""
+        repository = Mock()
+        repository.search_icons_bulk.return_value = {}
+        service = IconService(repository=repository, scraper=Mock())
+
+        assert service.search_icons_bulk([]) == {}
+
+    def test_search_icons_bulk_repository_error(self):
+        """Test that repository errors surface as IconCuratorError."""
+        repository = Mock()
+        repository.search_icons_bulk.side_effect = DatabaseError("boom")
+        service = IconService(repository=repository, scraper=Mock())
+
+        with pytest.raises(IconCuratorError, match="Failed to search icons"):
+            service.search_icons_bulk([("cat", None, 5)])
+
+    def test_search_icons_bulk_sqlalchemy_error(self):
+        """Test that a failing query is wrapped twice on its way out."""
+        session = Mock()
+        session.query.side_effect = SQLAlchemyError("connection lost")
+        service = IconService(repository=IconRepository(session), scraper=Mock())
+
+        with pytest.raises(IconCuratorError) as exc_info:
+            service.search_icons_bulk([("cat", None, 5)])
+
+        assert isinstance(exc_info.value.__cause__, DatabaseError)
+        assert isinstance(exc_info.value.__cause__.__cause__, SQLAlchemyError)
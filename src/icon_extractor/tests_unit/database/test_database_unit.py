@@ -138,6 +138,78 @@ class TestDatabaseWorkflowIntegration:
         print(f"   Searchable names: {len(names)}")
 
 
+class TestIconRepositorySearchIconsBulk:
+    """Unit tests for IconRepository.search_icons_bulk with a mocked session."""
+    
+    def setup_method(self):
+        """Set up a repository whose session returns canned rows."""
+        from src.icon_extractor.database.repository import IconRepository
+        
+        self.session = Mock()
+        self.query = self.session.query.return_value.join.return_value.order_by.return_value
+        self.query.all.return_value = []
+        self.repository = IconRepository(self.session)
+    
+    def _compiled_sql(self):
+        """Compile the UNION ALL statement the repository joined against, for PostgreSQL."""
+        from sqlalchemy.dialects import postgresql
+        
+        matches = self.session.query.return_value.join.call_args[0][0]
+        return str(matches.element.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        ))
+    
+    def test_search_icons_bulk_limits_and_filters_each_search(self):
+        """Test that every search gets its own LIMIT and only category searches filter by category."""
+        self.repository.search_icons_bulk([("cat", None, 5), ("cat", "Animals", 3)])
+        
+        sql = self._compiled_sql()
+        assert sql.count("UNION ALL") == 1
+        assert "LIMIT 5" in sql and "LIMIT 3" in sql
+        assert sql.count("icons.category = 'Animals'") == 1
+        assert sql.count("icons.name ILIKE") == 2
+    
+    def test_search_icons_bulk_orders_rows(self):
+        """Test that rows come back ordered by search, then icon id."""
+        self.repository.search_icons_bulk([("cat", None, 5)])
+        
+        from src.icon_extractor.database.models import IconModel
+        
+        search_index, icon_id = self.session.query.return_value.join.return_value.order_by.call_args[0]
+        assert search_index.name == "search_index"
+        assert icon_id is IconModel.id
+    
+    def test_search_icons_bulk_groups_rows_by_search(self):
+        """Test that duplicate searches collapse to one key and rows map back to their search."""
+        cat, dog = Mock(name="cat"), Mock(name="dog")
+        self.query.all.return_value = [(cat, 0), (dog, 1), (cat, 1)]
+        
+        results = self.repository.search_icons_bulk([
+            ("cat", None, 5), ("dog", None, 5), ("cat", None, 5), ("bird", "Animals", 3)
+        ])
+        
+        assert results == {
+            ("cat", None, 5): [cat],
+            ("dog", None, 5): [dog, cat],
+            ("bird", "Animals", 3): []
+        }
+        assert self._compiled_sql().count("UNION ALL") == 2
+    
+    def test_search_icons_bulk_empty(self):
+        """Test that no searches return no results without querying."""
+        assert self.repository.search_icons_bulk([]) == {}
+        self.session.query.assert_not_called()
+    
+    def test_search_icons_bulk_database_error(self):
+        """Test that SQLAlchemy errors are raised as DatabaseError."""
+        from sqlalchemy.exc import SQLAlchemyError
+        
+        self.query.all.side_effect = SQLAlchemyError("connection lost")
+        
+        with pytest.raises(DatabaseError, match="Failed to search icons"):
+            self.repository.search_icons_bulk([("cat", None, 5)])
+
+
 @skip_database
 class TestRealDatabaseIntegration:
     """Real database integration tests - requires PostgreSQL setup."""
@@ -3,7 +3,7 @@
 import logging
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Optional, Dict, Union, Any
+from typing import Optional, Dict, Iterator, Union, Any
 
 import whisper
 from pydub import AudioSegment
@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 class AudioProcessor:
     """Handles audio file processing and speech recognition."""
 
-    SUPPORTED_FORMATS = {"wav", "mp3", "m4a", "aac"}
+    SUPPORTED_FORMATS = frozenset({"wav", "mp3", "m4a", "aac"})
 
     def __init__(self, config: Optional[Dict] = None):
         """Initialize the audio processor with optional configuration."""
@@ -209,6 +209,41 @@ class AudioProcessor:
             print(f"Error during transcription: {e}")
             raise AudioProcessingError(f"Failed to extract text: {str(e)}") from e
 
+    def extract_text_windows(
+        self,
+        audio_file: Union[Path, AudioSegment],
+        window_seconds: float = 60.0,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Iterator[TranscriptionResult]:
+        """Transcribe audio in consecutive windows, yielding each as it completes.
+
+        Callers can start working on early windows while later ones are still
+        being transcribed. Windows that produce no text (e.g. silence) are skipped.
+
+        Args:
+            audio_file: Path to audio file or AudioSegment to transcribe
+            window_seconds: Length of each transcription window in seconds
+            options: Transcription options, as for extract_text
+
+        Yields:
+            TranscriptionResult for each window, in order
+
+        Raises:
+            AudioProcessingError: If the audio file cannot be loaded
+            ValueError: If window_seconds is not positive or options are invalid
+        """
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+
+        audio = audio_file if isinstance(audio_file, AudioSegment) else self.load_audio(audio_file)
+        window_ms = int(window_seconds * 1000)
+
+        for start_ms in range(0, len(audio), window_ms):
+            try:
+                yield self.extract_text(audio[start_ms:start_ms + window_ms], options)
+            except AudioProcessingError as e:
+                logger.warning(f"Skipping audio window at {start_ms / 1000:.0f}s: {e}")
+
     def get_audio_info(self, audio_data: AudioSegment) -> Dict:
         """
         Get audio file metadata.
@@ -2,10 +2,11 @@
 
 import re
 import logging
+import time
 import aiohttp
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from urllib.parse import urljoin
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urljoin, urlsplit
 import xml.etree.ElementTree as ET
 
 from media_analyzer.models.podcast import PodcastEpisode
@@ -18,10 +19,16 @@ logger = logging.getLogger(__name__)
 class RSSFeedConnector(PodcastPlatformConnector):
     """Connector for RSS/XML podcast feeds."""
     
+    # Downloaded feeds are reused for a short time, so analyzing several
+    # episodes of one show (or re-running an episode) fetches the feed once
+    FEED_CACHE_TTL_SECONDS = 300
+    FEED_CACHE_MAX_ENTRIES = 32
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize RSS connector."""
         super().__init__(config)
         self.session: Optional[aiohttp.ClientSession] = None
+        self._feed_cache: Dict[str, Tuple[float, str]] = {}
     
     def validate_url(self, url: str) -> bool:
         """Validate RSS feed URL format.
@@ -67,19 +74,45 @@ class RSSFeedConnector(PodcastPlatformConnector):
             raise ValidationError(f"Invalid RSS feed URL: {url}")
         
         try:
-            session = await self._get_session()
-            async with session.get(url, timeout=30) as response:
-                if response.status != 200:
-                    raise ConnectionError(f"Failed to fetch RSS feed: HTTP {response.status}")
-                
-                content = await response.text()
-                return self._parse_rss_feed(content, url, options)
+            content = await self._fetch_feed(url)
+            return self._parse_rss_feed(content, url, options)
                 
         except aiohttp.ClientError as e:
             raise ConnectionError(f"Failed to connect to RSS feed: {str(e)}")
         except ET.ParseError as e:
             raise ValueError(f"Invalid RSS feed format: {str(e)}")
     
+    async def _fetch_feed(self, url: str) -> str:
+        """Fetch RSS feed XML, reusing a recent download of the same feed.
+        
+        Args:
+            url: RSS feed URL
+            
+        Returns:
+            Feed XML content
+        """
+        # The fragment never reaches the server, so it shouldn't split the cache
+        cache_key = urlsplit(url)._replace(fragment='').geturl()
+        cached = self._feed_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.FEED_CACHE_TTL_SECONDS:
+            logger.debug(f"Using cached RSS feed for {url}")
+            return cached[1]
+        
+        session = await self._get_session()
+        async with session.get(url, timeout=30) as response:
+            if response.status != 200:
+                raise ConnectionError(f"Failed to fetch RSS feed: HTTP {response.status}")
+            
+            content = await response.text()
+        
+        self._feed_cache.pop(cache_key, None)
+        self._feed_cache[cache_key] = (time.monotonic(), content)
+        # Dicts keep insertion order, so the first entry is the oldest download
+        while len(self._feed_cache) > self.FEED_CACHE_MAX_ENTRIES:
+            del self._feed_cache[next(iter(self._feed_cache))]
+        
+        return content
+    
     async def get_audio_stream_url(self, episode: PodcastEpisode) -> str:
         """Get audio stream URL from RSS episode.
         
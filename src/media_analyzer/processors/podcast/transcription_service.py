@@ -318,6 +318,7 @@ class WhisperStreamingService(StreamingTranscriptionService):
             }
             # Create session with better connection management
             connector = aiohttp.TCPConnector(
+                limit=16,                    # Pool sized for a batch of concurrent episodes
                 enable_cleanup_closed=True,  # Enable cleanup of closed connections
                 keepalive_timeout=30,        # Reduce keepalive timeout
                 ttl_dns_cache=300            # DNS cache TTL
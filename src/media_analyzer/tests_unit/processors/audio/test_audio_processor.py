@@ -148,6 +148,27 @@ def test_error_handling(test_audio_file, mock_whisper):
     assert "Unsupported language" in str(exc_info.value)
 
 
+def test_extract_text_windows(mock_whisper):
+    """Test windowed transcription yields one result per window and skips empty ones."""
+    processor = AudioProcessor(config={"mock_model": True})
+    mock_whisper.transcribe.side_effect = [
+        {"text": "First window", "segments": []},
+        {"text": "", "segments": []},
+        {"text": "Last window", "segments": []}
+    ]
+    processor._model = mock_whisper
+    
+    audio = AudioSegment.silent(duration=2500)
+    results = list(processor.extract_text_windows(audio, window_seconds=1))
+    
+    assert [result.text for result in results] == ["First window", "Last window"]
+    assert mock_whisper.transcribe.call_count == 3
+    assert results[1].metadata["duration"] == 0.5
+    
+    with pytest.raises(ValueError, match="window_seconds"):
+        list(processor.extract_text_windows(audio, window_seconds=0))
+
+
 def test_supported_formats():
     """Test that processor declares supported formats correctly."""
     processor = AudioProcessor()
@@ -1,12 +1,12 @@
 """Integration tests for RSS podcast connector."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import xml.etree.ElementTree as ET
 from datetime import datetime
 
 from media_analyzer.processors.podcast.rss_connector import RSSFeedConnector
-from media_analyzer.models.podcast import PodcastEpisode
+from media_analyzer.models.podcast import AnalysisOptions, PodcastEpisode
 
 
 class TestRSSConnectorIntegration:
@@ -180,6 +180,47 @@ class TestRSSConnectorIntegration:
             episode = await connector.get_episode_metadata("https://example.com/feed.xml")
             assert episode is None
     
+    @pytest.mark.asyncio
+    async def test_feed_download_reused_within_ttl(self):
+        """Test that episodes from one feed share a single recent download."""
+        rss_xml = """<?xml version="1.0"?>
+        <rss version="2.0">
+          <channel>
+            <title>Cached Podcast</title>
+            <item>
+              <title>Newer Episode</title>
+              <enclosure url="https://example.com/new.mp3" type="audio/mpeg"/>
+            </item>
+            <item>
+              <title>Older Episode</title>
+              <enclosure url="https://example.com/old.mp3" type="audio/mpeg"/>
+            </item>
+          </channel>
+        </rss>"""
+        response = AsyncMock()
+        response.status = 200
+        response.text.return_value = rss_xml
+        session = MagicMock()
+        session.get.return_value.__aenter__.return_value = response
+        
+        connector = RSSFeedConnector()
+        with patch.object(connector, '_get_session', new_callable=AsyncMock, return_value=session):
+            newer = await connector.get_episode_metadata(
+                "https://example.com/feed.xml", AnalysisOptions(episode_index=0)
+            )
+            older = await connector.get_episode_metadata(
+                "https://example.com/feed.xml#latest", AnalysisOptions(episode_index=1)
+            )
+            
+            assert newer.title == "Newer Episode"
+            assert older.title == "Older Episode"
+            session.get.assert_called_once()
+            
+            # Expired downloads are fetched again
+            connector.FEED_CACHE_TTL_SECONDS = 0
+            await connector.get_episode_metadata("https://example.com/feed.xml")
+            assert session.get.call_count == 2
+    
     def test_episode_selection_latest_first(self):
         """Test that the latest episode is returned first."""
         rss_xml = """<?xml version="1.0"?>